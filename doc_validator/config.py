@@ -33,6 +33,14 @@ Path(INPUT_FOLDER).mkdir(exist_ok=True)
 # Subfolder for log inside each WP folder
 LOG_FOLDER = "log"
 
+# ------------------------------------------------------------
+# Per-user caches (HTTP responses for ETag revalidation, Drive listing)
+# ------------------------------------------------------------
+HTTP_CACHE_FOLDER = str(Path.home() / ".amos_validator" / "http_cache")
+
+# SQLite cache of the last Drive folder listing
+METADATA_CACHE_FILE = str(Path.home() / ".amos_validator" / "cache.sqlite3")
+
 # ------------------------------------------------------------
 # Other constants
 # ------------------------------------------------------------
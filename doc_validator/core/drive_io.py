@@ -10,11 +10,14 @@ Google Drive utilities for downloading files.
 
 import io
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from doc_validator.config import DATA_FOLDER, HTTP_CACHE_FOLDER
 
-from doc_validator.config import DATA_FOLDER
+# googleapiclient is imported inside the functions that need it: it is
+# slow to import and local-only sessions never touch it.
 
 
 def authenticate_drive_api(api_key):
@@ -27,6 +30,17 @@ def authenticate_drive_api(api_key):
     Returns:
         drive_service: Authenticated Google Drive service
     """
+    import httplib2
+    from googleapiclient.discovery import build
+    from googleapiclient.http import build_http
+
+    # On-disk HTTP cache: unchanged responses (including the discovery
+    # document) are revalidated with ETags and come back as 304s. It is
+    # meant for listings only; download_file_from_drive never sends media
+    # through this http, so file contents don't pile up in the cache.
+    http = build_http()
+    http.cache = httplib2.FileCache(HTTP_CACHE_FOLDER)
+
     # static_discovery=False forces the client to fetch the discovery
     # document from Google's servers instead of using a local JSON file
     # (which is missing in the PyInstaller bundle).
@@ -35,11 +49,18 @@ def authenticate_drive_api(api_key):
         "v3",
         developerKey=api_key,
         static_discovery=False,
+        http=http,
     )
     return drive_service
 
 
-def get_all_excel_files_from_folder(drive_service, folder_id):
+def get_all_excel_files_from_folder(
+        drive_service,
+        folder_id,
+        fields="nextPageToken, files(id, name, mimeType)",
+        page_size=1000,
+        extra_q=None,
+):
     """
     Get all Excel file IDs from the folder.
 
@@ -48,25 +69,48 @@ def get_all_excel_files_from_folder(drive_service, folder_id):
     Args:
         drive_service: Authenticated Google Drive service
         folder_id: Google Drive folder ID
+        fields: Partial-response field mask; keep nextPageToken in it so
+            folders spanning several pages are listed completely
+        page_size: Files per page (1000 is the Drive API maximum)
+        extra_q: Optional extra Drive query clause, ANDed onto the query
 
     Returns:
         list[dict]: List of file info dicts:
             [{'id': <str>, 'name': <str>, 'mimeType': <str>}, ...]
+
+    Raises:
+        Exception: Whatever the Drive client raised when the listing failed
+            (network error, bad API key, rate limit, ...)
     """
-    query = f"'{folder_id}' in parents and trashed=false"
+    # Sub-folders are dropped server-side. Excel files are still picked by
+    # extension below: uploads often carry a generic MIME type, and native
+    # Google Sheets can't be downloaded with get_media anyway.
+    query = (
+        f"'{folder_id}' in parents and trashed=false"
+        " and mimeType != 'application/vnd.google-apps.folder'"
+    )
+    if extra_q:
+        query += f" and ({extra_q})"
 
     try:
-        results = (
-            drive_service.files()
-            .list(
-                q=query,
-                fields="files(id, name, mimeType)",
-                orderBy="name",
+        all_files = []
+        page_token = None
+        while True:
+            results = (
+                drive_service.files()
+                .list(
+                    q=query,
+                    fields=fields,
+                    orderBy="name",
+                    pageSize=page_size,
+                    pageToken=page_token,
+                )
+                .execute()
             )
-            .execute()
-        )
-
-        all_files = results.get("files", [])
+            all_files.extend(results.get("files", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
 
         if not all_files:
             print("No files found in the folder.")
@@ -92,7 +136,7 @@ def get_all_excel_files_from_folder(drive_service, folder_id):
 
     except Exception as e:  # pragma: no cover - runtime-only path
         print(f"❌ Error accessing Google Drive folder: {str(e)}")
-        return []
+        raise
 
 
 def get_file_id_from_folder(drive_service, folder_id):
@@ -126,7 +170,7 @@ def get_file_id_from_folder(drive_service, folder_id):
     return file_id
 
 
-def download_file_from_drive(drive_service, file_id, wp_value, file_name=None):
+def download_file_from_drive(drive_service, file_id, wp_value, file_name=None, http=None):
     """
     Download file from Google Drive to a specific folder.
 
@@ -135,10 +179,15 @@ def download_file_from_drive(drive_service, file_id, wp_value, file_name=None):
         file_id: Google Drive file ID to download
         wp_value: Work package value for folder naming
         file_name: Optional custom filename (if None, uses default naming)
+        http: Optional httplib2.Http to download with (httplib2 objects
+            can't be shared across threads). When None, a fresh non-caching
+            one is built; the service's own http has the on-disk cache.
 
     Returns:
         file_path: Path to the downloaded file, or None on error
     """
+    from googleapiclient.http import MediaIoBaseDownload, build_http
+
     # Create folder if it doesn't exist
     wp_folder = os.path.join(DATA_FOLDER, wp_value)
     os.makedirs(wp_folder, exist_ok=True)
@@ -151,6 +200,7 @@ def download_file_from_drive(drive_service, file_id, wp_value, file_name=None):
 
     try:
         request = drive_service.files().get_media(fileId=file_id)
+        request.http = http if http is not None else build_http()
         fh = io.FileIO(file_path, "wb")
         downloader = MediaIoBaseDownload(fh, request)
         done = False
@@ -166,19 +216,27 @@ def download_file_from_drive(drive_service, file_id, wp_value, file_name=None):
         return None
 
 
-def download_all_excel_files(drive_service, folder_id):
+def download_all_excel_files(drive_service, folder_id, max_workers=8):
     """
     Download all Excel files from a Google Drive folder.
 
+    Files are downloaded concurrently, each thread with its own HTTP
+    connection. Files sharing a name go to the same path, so those are
+    downloaded one after another, in listing order, by a single thread.
+
     Args:
         drive_service: Authenticated Google Drive service
         folder_id: Google Drive folder ID
+        max_workers: Maximum number of concurrent downloads
 
     Returns:
         list[dict]: List of downloaded file info:
             [{'path': <local_path>, 'name': <filename>, 'id': <file_id>}, ...]
     """
-    files = get_all_excel_files_from_folder(drive_service, folder_id)
+    try:
+        files = get_all_excel_files_from_folder(drive_service, folder_id)
+    except Exception:  # pragma: no cover - runtime-only path
+        return []  # already reported by get_all_excel_files_from_folder
 
     if not files:
         return []
@@ -187,17 +245,44 @@ def download_all_excel_files(drive_service, folder_id):
 
     print(f"\n📥 Downloading {len(files)} file(s)...\n")
 
+    from googleapiclient.http import build_http
+
+    by_name = {}
     for i, file in enumerate(files, 1):
-        print(f"[{i}/{len(files)}] Downloading: {file['name']}")
-
-        # Use 'temp_download' folder for the batch download
-        file_path = download_file_from_drive(
-            drive_service,
-            file["id"],
-            "temp_download",
-            file["name"],  # Preserve original filename
+        by_name.setdefault(file["name"], []).append((i, file))
+
+    thread_local = threading.local()
+
+    def download_group(group):
+        http = getattr(thread_local, "http", None)
+        if http is None:
+            http = thread_local.http = build_http()
+        outcomes = []
+        for i, file in group:
+            print(f"[{i}/{len(files)}] Downloading: {file['name']}")
+
+            # Use 'temp_download' folder for the batch download
+            file_path = download_file_from_drive(
+                drive_service,
+                file["id"],
+                "temp_download",
+                file["name"],  # Preserve original filename
+                http=http,
+            )
+            outcomes.append((i, file, file_path))
+        return outcomes
+
+    with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(by_name))),
+            thread_name_prefix="drive-download",
+    ) as executor:
+        outcomes = sorted(
+            (outcome for group in executor.map(download_group, by_name.values())
+             for outcome in group),
+            key=lambda outcome: outcome[0],
         )
 
+    for i, file, file_path in outcomes:
         if file_path:
             downloaded_files.append(
                 {
@@ -233,18 +318,13 @@ def read_credentials_file(filename):
     """
     try:
         with open(filename, "r") as file:
-            content = file.readlines()
-
-        api_key = None
-        folder_id = None
-
-        for line in content:
-            if line.startswith("GG_API_KEY="):
-                api_key = line.split("=", 1)[1].strip()
-            elif line.startswith("GG_FOLDER_ID="):
-                folder_id = line.split("=", 1)[1].strip()
+            # KEY=value lines; a repeated key keeps its last value
+            values = {
+                key: value.strip()
+                for key, value in re.findall(r"^(\w+)=(.*)$", file.read(), re.MULTILINE)
+            }
 
-        return api_key, folder_id
+        return values.get("GG_API_KEY"), values.get("GG_FOLDER_ID")
 
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
@@ -1,18 +1,29 @@
 # doc_validator/core/excel_io.py
 
+import math
 import os
 import re
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
+from pandas.api.types import is_bool, is_float, is_integer, is_scalar
 
 from doc_validator.config import DATA_FOLDER, LOG_FOLDER, INVALID_CHARACTERS
 
+# INVALID_CHARACTERS is a class of single ASCII characters, so the
+# substitution is a plain character mapping
+_INVALID_CHARACTERS_TABLE = str.maketrans({
+    c: "_" for c in map(chr, range(128)) if re.fullmatch(INVALID_CHARACTERS, c)
+})
+
 
 def sanitize_folder_name(wp_value: str) -> str:
     """Clean folder name by removing invalid characters."""
     if isinstance(wp_value, str) and wp_value.strip():
-        cleaned_wp_value = re.sub(INVALID_CHARACTERS, "_", wp_value)
+        cleaned_wp_value = wp_value.translate(_INVALID_CHARACTERS_TABLE)
         return cleaned_wp_value
     return "No_wp_found"
 
@@ -140,6 +151,10 @@ def append_to_logbook(wp_value, counts, processing_time=None):
         else None,
     }
 
+    if os.path.exists(logbook_path) and _append_logbook_row(logbook_path, row):
+        print(f"✓ Logbook updated: {logbook_path}")
+        return
+
     if os.path.exists(logbook_path):
         existing_df = pd.read_excel(logbook_path)
         row["Order"] = len(existing_df) + 1
@@ -152,6 +167,29 @@ def append_to_logbook(wp_value, counts, processing_time=None):
     print(f"✓ Logbook updated: {logbook_path}")
 
 
+def _append_logbook_row(logbook_path: str, row: dict) -> bool:
+    """
+    Append row to an existing logbook as one more sheet row, without
+    loading the logbook into a DataFrame and writing it all back.
+
+    Returns False (nothing written) if the logbook's header isn't
+    exactly the row's keys; the caller then rebuilds the file.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(logbook_path)
+    sheet = workbook.worksheets[0]
+    header = [cell.value for cell in sheet[1]]
+    if header != list(row):
+        return False
+
+    # Header plus one line per earlier run
+    row["Order"] = sheet.max_row
+    sheet.append(list(row.values()))
+    workbook.save(logbook_path)
+    return True
+
+
 def read_input_excel(file_path: str) -> pd.DataFrame:
     """
     Read the input Excel file with the strict settings used in the original code,
@@ -177,16 +215,24 @@ def reread_original_for_debug(file_path: str) -> pd.DataFrame:
     return read_input_excel(file_path)
 
 
-def save_debug_input_output(file_path: str, df_processed: pd.DataFrame) -> None:
+def save_debug_input_output(
+        file_path: str,
+        df_processed: pd.DataFrame,
+        df_original: pd.DataFrame | None = None,
+) -> None:
     """
     Save input and output CSVs to a DEBUG folder for row loss diagnosis.
+
+    df_original is the input as read by read_input_excel(); when not
+    given, file_path is read again.
     """
     debug_folder = os.path.join(os.path.dirname(file_path), "DEBUG")
     os.makedirs(debug_folder, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    df_original = reread_original_for_debug(file_path)
+    if df_original is None:
+        df_original = reread_original_for_debug(file_path)
 
     debug_input = os.path.join(debug_folder, f"input_original_{timestamp}.csv")
     debug_output = os.path.join(debug_folder, f"output_processed_{timestamp}.csv")
@@ -217,6 +263,48 @@ def build_output_path(wp_value: str) -> tuple[str, str]:
     return cleaned_folder_name, output_file
 
 
+def _excel_value(sheet, value):
+    """
+    Convert one DataFrame value for sheet.append(), the way to_excel()
+    does: missing -> "", numpy scalars -> Python, dates get a number
+    format.
+    """
+    if is_scalar(value) and pd.isna(value):
+        return ""
+    if is_integer(value):
+        return int(value)
+    if is_float(value):
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return float(value)
+    if is_bool(value):
+        return bool(value)
+    if isinstance(value, (datetime, date, timedelta)):
+        if isinstance(value, timedelta):
+            cell, number_format = WriteOnlyCell(sheet, value.total_seconds() / 86400), "0"
+        elif isinstance(value, datetime):
+            cell, number_format = WriteOnlyCell(sheet, value), "YYYY-MM-DD HH:MM:SS"
+        else:
+            cell, number_format = WriteOnlyCell(sheet, value), "YYYY-MM-DD"
+        cell.number_format = number_format
+        return cell
+    return str(value)
+
+
+def _write_sheet(workbook: Workbook, sheet_name: str, df: pd.DataFrame) -> None:
+    """
+    Stream df (header row, no index) into a new sheet of a write-only
+    workbook, with an auto filter over the written range.
+    """
+    sheet = workbook.create_sheet(sheet_name)
+    last_col_letter = get_column_letter(max(len(df.columns), 1))
+    sheet.auto_filter.ref = f"A1:{last_col_letter}{len(df) + 1}"
+
+    sheet.append([_excel_value(sheet, label) for label in df.columns])
+    for values in df.itertuples(index=False, name=None):
+        sheet.append([_excel_value(sheet, value) for value in values])
+
+
 def write_output_excel(
         df: pd.DataFrame,
         output_file: str,
@@ -245,38 +333,20 @@ def write_output_excel(
 
     # Filter DataFrame to only include these columns (if they exist)
     available_columns = [col for col in output_columns if col in df.columns]
-    df_filtered = df[available_columns].copy()
-
-    with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-        # --- main sheet renamed to "REF/REV" ---
-        df_filtered.to_excel(writer, index=False, header=True, sheet_name="REF REV")
-
-        workbook = writer.book
-        main_sheet = workbook["REF REV"]
-
-        # Auto filter on main sheet
-        last_row = main_sheet.max_row
-        last_col_letter = main_sheet.cell(
-            row=1,
-            column=main_sheet.max_column,
-        ).column_letter
-        main_sheet.auto_filter.ref = f"A1:{last_col_letter}{last_row}"
-
-        # --- optional extra sheets ---
-        if extra_sheets:
-            for sheet_name, extra_df in extra_sheets.items():
-                extra_df.to_excel(
-                    writer,
-                    index=False,
-                    header=True,
-                    sheet_name=sheet_name,
-                )
-                sheet = workbook[sheet_name]
-                last_row = sheet.max_row
-                last_col_letter = sheet.cell(
-                    row=1,
-                    column=sheet.max_column,
-                ).column_letter
-                sheet.auto_filter.ref = f"A1:{last_col_letter}{last_row}"
+    df_filtered = df[available_columns]
+
+    # Write-only workbook: rows are streamed to the file instead of
+    # building a Cell object for every value first
+    workbook = Workbook(write_only=True)
+
+    # --- main sheet renamed to "REF/REV" ---
+    _write_sheet(workbook, "REF REV", df_filtered)
+
+    # --- optional extra sheets ---
+    if extra_sheets:
+        for sheet_name, extra_df in extra_sheets.items():
+            _write_sheet(workbook, sheet_name, extra_df)
+
+    workbook.save(output_file)
 
     print(f"   ✓ File saved: {os.path.basename(output_file)}")
\ No newline at end of file
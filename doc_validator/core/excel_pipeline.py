@@ -1,10 +1,11 @@
 # doc_validator/core/excel_pipeline.py
 
 from datetime import datetime, date
+from typing import Callable
 
 import pandas as pd
 
-from doc_validator.validation.engine import check_ref_keywords
+from doc_validator.validation.engine import check_ref_keywords_batch
 from doc_validator.config import (
     ACTION_STEP_CONTROL_ENABLED_DEFAULT,
     ACTION_STEP_SHEET_NAME,
@@ -12,7 +13,6 @@ from doc_validator.config import (
     ACTION_STEP_SUMMARY_SHEET_NAME,
 )
 from doc_validator.tools.action_step_control import compute_action_step_control_df
-from doc_validator.tools.action_step_control import compute_action_step_control_df
 from doc_validator.validation.helpers import (
     contains_header_skip_keyword,
     is_seq_auto_valid,
@@ -396,6 +396,7 @@ def process_excel(
         filter_start_date=None,
         filter_end_date=None,
         enable_action_step_control: bool = ACTION_STEP_CONTROL_ENABLED_DEFAULT,
+        progress_callback: Callable[[float], None] | None = None,
 ) -> str | None:
     """
     Process Excel file with multi-state validation and optional date filtering.
@@ -404,10 +405,16 @@ def process_excel(
         file_path: Path to Excel file
         filter_start_date: Optional start date for filtering
         filter_end_date: Optional end date for filtering
+        progress_callback: Optional; called with the fraction of this
+            file done (0.0-1.0) as each processing step finishes
 
     Returns:
         Output Excel file path or None on error.
     """
+    def report(fraction: float) -> None:
+        if progress_callback is not None:
+            progress_callback(fraction)
+
     print("\n" + "=" * 60)
     print("PROCESSING EXCEL FILE")
     print("=" * 60)
@@ -419,12 +426,19 @@ def process_excel(
         print(f"\n1. Reading file: {file_path}")
         df = read_input_excel(file_path)
         print(f"   ✓ Read {df.shape[0]} rows, {df.shape[1]} columns")
-
-        empty_rows = df[
-            df.apply(lambda x: x.astype(str).str.strip().eq("").all(), axis=1)
-        ]
-        if not empty_rows.empty:
-            print(f"   ⚠️ Found {len(empty_rows)} completely empty rows")
+        # Input as read, for the row-loss debug dump; a shallow copy, as
+        # apply_date_filter replaces the action_date column on its input
+        df_input = df.copy(deep=False)
+        report(0.2)
+
+        # Column by column rather than apply(axis=1), which builds a
+        # Series per row
+        is_empty_row = pd.Series(True, index=df.index)
+        for _, column in df.items():
+            is_empty_row &= column.astype(str).str.strip().eq("")
+        empty_count = int(is_empty_row.sum())
+        if empty_count:
+            print(f"   ⚠️ Found {empty_count} completely empty rows")
 
         # ========== STEP 2: Apply Date Filter (always) ==========
         step_num = 2
@@ -445,6 +459,7 @@ def process_excel(
             return None
 
         print(f"   ✓ {len(df)} rows after date filtering")
+        report(0.3)
         step_num += 1
 
         # ========== STEP 3: Validate DataFrame ==========
@@ -470,27 +485,28 @@ def process_excel(
             "OPEN/CLOSE ACCESS, GENERAL will be marked as Valid"
         )
 
-        df["Reason"] = df.apply(
-            lambda row: check_ref_keywords(
-                row["wo_text_action.text"],
-                row["SEQ"],
-                row["wo_text_action.header"],
-                row["DES"],
-            ),
-            axis=1,
-        )
+        # Categorical: a handful of distinct reasons, stored as small
+        # integer codes instead of one string reference per row
+        df["Reason"] = pd.Categorical(check_ref_keywords_batch(
+            df["wo_text_action.text"],
+            df["SEQ"],
+            df["wo_text_action.header"],
+            df["DES"],
+        ))
 
         print("   ✓ Validation complete")
+        report(0.6)
         step_num += 1
 
         # ========== STEP 6: Statistics ==========
+        reason_counts = df["Reason"].value_counts()
         counts = {
             "orig_rows": orig_rows,
             "out_rows": int(df.shape[0]),
-            "Missing reference": int((df["Reason"] == "Missing reference").sum()),
-            "Missing revision": int((df["Reason"] == "Missing revision").sum()),
-            "Valid": int((df["Reason"] == "Valid").sum()),
-            "N/A": int((df["Reason"] == "N/A").sum()),
+            "Missing reference": int(reason_counts.get("Missing reference", 0)),
+            "Missing revision": int(reason_counts.get("Missing revision", 0)),
+            "Valid": int(reason_counts.get("Valid", 0)),
+            "N/A": int(reason_counts.get("N/A", 0)),
             "header_auto_valid": int(
                 df["wo_text_action.header"].apply(contains_header_skip_keyword).sum()
             )
@@ -515,7 +531,7 @@ def process_excel(
                 f"      LOST ROWS: "
                 f"{counts['orig_rows'] - counts['out_rows']}"
             )
-            save_debug_input_output(file_path, df)
+            save_debug_input_output(file_path, df, df_original=df_input)
 
         # Verify counts
         total_counted = sum(
@@ -578,13 +594,16 @@ def process_excel(
             print(f"   [ASC] Extra sheets: {', '.join(extra_sheets.keys())}")
         else:
             print("   [ASC] Action Step Control disabled or not available")
+        report(0.75)
         # ========== STEP 8: Write Excel ==========
         print(f"   Writing to: {output_file}")
         write_output_excel(df, output_file, extra_sheets=extra_sheets)
+        report(0.95)
 
         # ========== STEP 9: Logbook ==========
         processing_time = (datetime.now() - start_time).total_seconds()
         append_to_logbook(cleaned_folder_name, counts, processing_time)
+        report(1.0)
 
         # Summary
         print("\n" + "=" * 60)
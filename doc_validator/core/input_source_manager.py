@@ -6,7 +6,7 @@ Manages loading Excel files from different sources:
 - Google Drive folder
 """
 
-from pathlib import Path
+import os
 from typing import List, Optional
 from dataclasses import dataclass
 
@@ -17,7 +17,7 @@ from doc_validator.core.drive_io import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileInfo:
     """Information about an Excel file from any source."""
     name: str
@@ -29,7 +29,8 @@ class FileInfo:
     mime_type: Optional[str] = None
 
 
-type_of_input_file = ["*.xlsx", "*.xls", "*.XLSX", "*.XLS"]
+# Matched case-insensitively against the file suffix
+excel_file_extensions = {".xlsx", ".xls"}
 
 
 def get_local_excel_files(folder_path: str) -> List[FileInfo]:
@@ -42,29 +43,25 @@ def get_local_excel_files(folder_path: str) -> List[FileInfo]:
     Returns:
         List of FileInfo objects for local Excel files
     """
-    folder = Path(folder_path)
-
-    if not folder.exists() or not folder.is_dir():
-        return []
-
     excel_files = []
 
-    # Find all Excel files (case-insensitive)
-    seen = set()
-    for pattern in type_of_input_file:
-        for file_path in folder.glob(pattern):
-            if not file_path.is_file():
-                continue
-            if file_path.resolve() in seen:
-                continue
-            seen.add(file_path.resolve())
-            excel_files.append(
-                FileInfo(
-                    name=file_path.name,
-                    source_type="local",
-                    local_path=str(file_path),
+    # One directory pass; DirEntry.is_file() usually needs no extra stat
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() not in excel_file_extensions:
+                    continue
+                if not entry.is_file():
+                    continue
+                excel_files.append(
+                    FileInfo(
+                        name=entry.name,
+                        source_type="local",
+                        local_path=entry.path,
+                    )
                 )
-            )
+    except OSError:
+        return []
 
     # Sort by name
     excel_files.sort(key=lambda x: x.name.lower())
@@ -72,33 +69,36 @@ def get_local_excel_files(folder_path: str) -> List[FileInfo]:
     return excel_files
 
 
-def get_drive_excel_files(api_key: str, folder_id: str) -> List[FileInfo]:
+def get_drive_excel_files(api_key: str, folder_id: str, drive_service=None) -> List[FileInfo]:
     """
     Get all Excel files from Google Drive folder.
 
     Args:
         api_key: Google Drive API key
         folder_id: Google Drive folder ID
+        drive_service: Previously built Drive service to reuse; a new one
+            is built from api_key when None
 
     Returns:
         List of FileInfo objects for Drive Excel files
+
+    Raises:
+        Exception: When authentication or the folder listing fails, so the
+            caller can tell a failure from an empty folder
     """
-    try:
+    if drive_service is None:
         drive_service = authenticate_drive_api(api_key)
-        drive_files = get_all_excel_files_from_folder(drive_service, folder_id)
-
-        return [
-            FileInfo(
-                name=f["name"],
-                source_type="drive",
-                file_id=f["id"],
-                mime_type=f.get("mimeType", ""),
-            )
-            for f in drive_files
-        ]
-    except Exception as e:
-        print(f"Error loading Drive files: {e}")
-        return []
+    drive_files = get_all_excel_files_from_folder(drive_service, folder_id)
+
+    return [
+        FileInfo(
+            name=f["name"],
+            source_type="drive",
+            file_id=f["id"],
+            mime_type=f.get("mimeType", ""),
+        )
+        for f in drive_files
+    ]
 
 
 def get_default_input_folder() -> str:
@@ -0,0 +1,96 @@
+# doc_validator/core/metadata_cache.py
+"""
+Local SQLite cache of the last Drive folder listing.
+
+The GUI shows the cached listing straight away and refreshes it from
+Drive in the background. Only one folder is kept: saving a listing
+drops whatever was cached for any other folder.
+"""
+
+import os
+import sqlite3
+import time
+from typing import List, Optional, Tuple
+
+from doc_validator.config import METADATA_CACHE_FILE
+from doc_validator.core.input_source_manager import FileInfo
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS folders (
+    folder_id  TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    folder_id TEXT NOT NULL,
+    position  INTEGER NOT NULL,
+    id        TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    mime_type TEXT,
+    PRIMARY KEY (folder_id, position)
+);
+"""
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def load(folder_id: str, db_path: str = METADATA_CACHE_FILE) -> Optional[Tuple[List[FileInfo], float]]:
+    """
+    Return (files, fetched_at) for the cached folder listing.
+
+    Returns None when nothing is cached for folder_id or the cache
+    can't be read.
+    """
+    try:
+        conn = _connect(db_path)
+        try:
+            row = conn.execute(
+                "SELECT fetched_at FROM folders WHERE folder_id = ?", (folder_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            files = [
+                FileInfo(name=name, source_type="drive", file_id=file_id, mime_type=mime_type)
+                for file_id, name, mime_type in conn.execute(
+                    "SELECT id, name, mime_type FROM files"
+                    " WHERE folder_id = ? ORDER BY position",
+                    (folder_id,),
+                )
+            ]
+            return files, row[0]
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Warning: could not read Drive metadata cache: {e}")
+        return None
+
+
+def save(folder_id: str, files: List[FileInfo], db_path: str = METADATA_CACHE_FILE) -> None:
+    """Replace the cached listing with files for folder_id."""
+    try:
+        conn = _connect(db_path)
+        try:
+            with conn:
+                conn.execute("DELETE FROM files")
+                conn.execute("DELETE FROM folders")
+                conn.executemany(
+                    "INSERT INTO files (folder_id, position, id, name, mime_type)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (folder_id, position, f.file_id, f.name, f.mime_type)
+                        for position, f in enumerate(files)
+                    ),
+                )
+                conn.execute(
+                    "INSERT INTO folders (folder_id, fetched_at) VALUES (?, ?)",
+                    (folder_id, time.time()),
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Warning: could not write Drive metadata cache: {e}")
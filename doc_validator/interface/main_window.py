@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import os
-import platform
-import subprocess
 import sys
-from datetime import date, datetime
+import time
+from bisect import bisect_right
+from datetime import date
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QTextCursor, QColor, QFont, QIcon, QPixmap
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QTextCursor, QIcon, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,9 +21,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
+    QPlainTextEdit,
     QMessageBox,
     QHeaderView,
     QLineEdit,
@@ -31,21 +31,109 @@ from PyQt6.QtWidgets import (
     QSplitter,
 )
 
-from doc_validator.config import LINK_FILE, INPUT_FOLDER, APP_VERSION, APP_LAST_UPDATE
+from doc_validator.config import (
+    LINK_FILE,
+    INPUT_FOLDER,
+    DATA_FOLDER,
+    APP_VERSION,
+    APP_LAST_UPDATE,
+)
 from doc_validator.core.drive_io import read_credentials_file
+from doc_validator.core import metadata_cache
 from doc_validator.core.input_source_manager import (
     FileInfo,
     get_local_excel_files,
-    get_drive_excel_files,
 )
+from doc_validator.interface.models.file_list_model import FileListModel, HEADER_ICON_SIZE
 from doc_validator.interface.panels.date_filter_panel import DateFilterPanel
 from doc_validator.interface.styles.theme import get_dark_theme_stylesheet
+from doc_validator.interface.workers.drive_list_worker import DriveListWorker
 from doc_validator.interface.workers.processing_worker import ProcessingWorker
 from doc_validator.interface.settings_manager import SettingsManager
-from doc_validator.interface.settings_dialog import SettingsDialog
+from doc_validator.interface.settings_dialog import SETTINGS_DIALOG_QSS, SettingsDialog
 from doc_validator.validation.helpers import set_seq_auto_valid_patterns
 
 
+TABLE_ROW_HEIGHT = 30
+
+# Oldest console lines are dropped beyond this many blocks
+LOG_MAX_BLOCKS = 5000
+# Queued log text is written to the console at most this often
+LOG_FLUSH_INTERVAL_MS = 50
+
+# A cached Drive listing younger than this is shown without re-listing
+DRIVE_CACHE_TTL_SECONDS = 300
+
+# Style sheets, built once at import. _TABLE_QSS and the settings
+# dialog's sheet are appended to the window's theme sheet; _PROGRESS_QSS
+# is set on the progress bar.
+_TABLE_QSS = """
+    QTableView {
+        gridline-color: #3a3a3a;
+        background-color: #2a2a2a;
+        alternate-background-color: #252525;
+        border: 2px solid #444;
+        border-radius: 5px;
+    }
+    QTableView::item {
+        padding: 6px;
+        border: none;
+    }
+    QTableView::item:selected {
+        background-color: #1976D2;
+    }
+    QHeaderView::section {
+        background-color: #333;
+        color: #2196F3;
+        padding: 8px;
+        border: none;
+        border-right: 1px solid #444;
+        font-weight: bold;
+    }
+    QTableView::indicator {
+        width: 20px;
+        height: 20px;
+        border-radius: 4px;
+    }
+    QTableView::indicator:unchecked {
+        background-color: #333;
+        border: 2px solid #666;
+    }
+    QTableView::indicator:unchecked:hover {
+        background-color: #3a3a3a;
+        border-color: #2196F3;
+    }
+    QTableView::indicator:checked {
+        background-color: #2196F3;
+        border: 2px solid #2196F3;
+        image: url(none);
+    }
+    QTableView::indicator:checked:hover {
+        background-color: #42A5F5;
+    }
+"""
+
+_PROGRESS_QSS = """
+    QProgressBar {
+        border: 2px solid #444;
+        border-radius: 8px;
+        text-align: center;
+        height: 24px;
+        background: #2a2a2a;
+        color: white;
+        font-weight: bold;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #2196F3,
+            stop:1 #42A5F5
+        );
+        border-radius: 6px;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -53,8 +141,9 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("AMOS Documentation Validator")
         self.resize(1200, 800)
 
-        # Apply dark theme
-        self.setStyleSheet(get_dark_theme_stylesheet())
+        # Apply dark theme; the table rules ride along in the same sheet so
+        # the table has no per-widget style sheet of its own
+        self.setStyleSheet(get_dark_theme_stylesheet() + _TABLE_QSS + SETTINGS_DIALOG_QSS)
 
         # Initialize settings manager
         self.settings = SettingsManager()
@@ -66,11 +155,23 @@ class MainWindow(QMainWindow):
         # Credentials / Drive folder info
         self.api_key: Optional[str] = None
         self.folder_id: Optional[str] = None
+        # Drive service built by the first listing, reused by later refreshes.
+        # Only DriveListWorker touches it, one listing at a time.
+        self._drive_service = None
 
         # File source management
         self.all_files: List[FileInfo] = []
-        self.filtered_files: List[FileInfo] = []
+        # Indices into all_files of the rows shown (a range when unfiltered)
+        self.filtered_indices: Sequence[int] = range(0)
+        # Search index, rebuilt on every load: all lower-cased names joined
+        # by "\n", plus the end offset of each name within that blob
+        self._name_blob: str = ""
+        self._name_ends: List[int] = []
+        # Needle behind filtered_indices ("" = unfiltered)
+        self._last_needle: str = ""
         self._status_row_map: dict[str, list[int]] = {}
+        # folder path -> (directory mtime_ns, listing); skips unchanged rescans
+        self._local_cache: dict[str, tuple[int, List[FileInfo]]] = {}
 
         # Load source settings with proper defaults
         self.current_source_type: str = self.settings.get("input_source_type", "local")
@@ -81,8 +182,15 @@ class MainWindow(QMainWindow):
             self.current_local_path = INPUT_FOLDER
             self.settings.set("input_local_path", INPUT_FOLDER)
 
-        # Worker thread reference
+        # (checked_at, exists) for DATA_FOLDER; spares repeat clicks a restat
+        self._data_dir_cache: tuple[float, bool] = (0.0, False)
+
+        # Created on first open, then reused
+        self._settings_dialog: Optional[SettingsDialog] = None
+
+        # Worker thread references
         self.worker: Optional[ProcessingWorker] = None
+        self.drive_worker: Optional[DriveListWorker] = None
 
         # Build UI
         self._setup_ui()
@@ -90,14 +198,15 @@ class MainWindow(QMainWindow):
         # Load credentials
         self._load_credentials()
 
-        # Load files from current source
-        self._load_files_from_current_source()
+        # Load files once the event loop runs, so the window paints first
+        # (the Drive listing itself then runs on DriveListWorker)
+        QTimer.singleShot(0, self._load_files_from_current_source)
 
     def _on_header_clicked(self, index: int) -> None:
         """Handle clicks on table header sections."""
         if index == 0:
             # Click on the first header cell = refresh
-            self._load_files_from_current_source()
+            self._load_files_from_current_source(force_refresh=True)
 
     # ---------------------- UI Setup ----------------------
 
@@ -184,6 +293,13 @@ class MainWindow(QMainWindow):
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Type to filter files by name...")
         self.search_bar.textChanged.connect(self._on_search_changed)
+
+        # Debounce: a burst of keystrokes produces a single filter pass
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search)
         self.search_bar.setClearButtonEnabled(True)
         self.search_bar.setStyleSheet("""
             QLineEdit {
@@ -231,19 +347,20 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(filter_row)
 
         # ========== FILE LIST TABLE ==========
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "", "File Name", "Source", "Size", "Modified", "Status"
-        ])
+        project_root = Path(__file__).resolve().parent.parent
+        refresh_icon_path = project_root / "resources" / "icons" / "refresh.png"
+
+        # Refresh icon lives in the first header cell
+        self.file_model = FileListModel(self, refresh_icon=QIcon(str(refresh_icon_path)))
+        self.table = QTableView()
+        self.table.setModel(self.file_model)
 
         # Column sizes
         header = self.table.horizontalHeader()
 
         # Refresh column (0) – fixed size, square-ish
-        refresh_size = 32
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        header.resizeSection(0, refresh_size + 4)
+        header.resizeSection(0, HEADER_ICON_SIZE + 4)
 
         # Other columns
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # File Name
@@ -252,71 +369,21 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Modified
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Status
 
-        header.setMinimumHeight(refresh_size + 4)
-
-        # Refresh icon in first header cell
-        refresh_item = QTableWidgetItem()
-        project_root = Path(__file__).resolve().parent.parent
-        refresh_icon_path = project_root / "resources" / "icons" / "refresh.png"
-        refresh_item.setIcon(QIcon(str(refresh_icon_path)))
-        refresh_item.setText("")
-        refresh_item.setSizeHint(QSize(refresh_size, refresh_size))
-        self.table.setHorizontalHeaderItem(0, refresh_item)
+        header.setMinimumHeight(HEADER_ICON_SIZE + 4)
 
         # Click on header[0] = refresh
         header.sectionClicked.connect(self._on_header_clicked)
 
-        self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Every row is single-line text: fix the height so Qt never
+        # measures rows individually
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(TABLE_ROW_HEIGHT)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
 
-        self.table.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #3a3a3a;
-                background-color: #2a2a2a;
-                alternate-background-color: #252525;
-                border: 2px solid #444;
-                border-radius: 5px;
-            }
-            QTableWidget::item {
-                padding: 6px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background-color: #1976D2;
-            }
-            QHeaderView::section {
-                background-color: #333;
-                color: #2196F3;
-                padding: 8px;
-                border: none;
-                border-right: 1px solid #444;
-                font-weight: bold;
-            }
-            QTableWidget::indicator {
-                width: 20px;
-                height: 20px;
-                border-radius: 4px;
-            }
-            QTableWidget::indicator:unchecked {
-                background-color: #333;
-                border: 2px solid #666;
-            }
-            QTableWidget::indicator:unchecked:hover {
-                background-color: #3a3a3a;
-                border-color: #2196F3;
-            }
-            QTableWidget::indicator:checked {
-                background-color: #2196F3;
-                border: 2px solid #2196F3;
-                image: url(none);
-            }
-            QTableWidget::indicator:checked:hover {
-                background-color: #42A5F5;
-            }
-        """)
-
         main_layout.addWidget(self.table, 1)  # stretch to fill
 
         # ========== TABLE CONTROL BUTTONS ==========
@@ -380,27 +447,18 @@ class MainWindow(QMainWindow):
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(True)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #444;
-                border-radius: 8px;
-                text-align: center;
-                height: 24px;
-                background: #2a2a2a;
-                color: white;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2196F3,
-                    stop:1 #42A5F5
-                );
-                border-radius: 6px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_PROGRESS_QSS)
         progress_layout.addWidget(self.progress_bar)
 
+        # Worker progress is applied at most ~30 times per second
+        self._pending_progress: Optional[tuple[int, str]] = None
+        # What the bar/label currently show, to skip identical repaints
+        self._last_progress: Optional[tuple[int, str]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self.progress_container.hide()
         main_layout.addWidget(self.progress_container)
 
@@ -435,11 +493,12 @@ class MainWindow(QMainWindow):
 
         main_layout.addLayout(console_header)
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.log_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-family: 'Consolas', 'Courier New', monospace;
                 font-size: 11px;
                 background: #1a1a1a;
@@ -452,13 +511,23 @@ class MainWindow(QMainWindow):
         self.log_text.setMaximumHeight(200)
         main_layout.addWidget(self.log_text)
 
+        # Log chunks are queued and written in one insert per flush interval
+        self._log_buffer: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        # Document cursor reused by every flush (the view's cursor is left alone)
+        self._log_cursor = QTextCursor(self.log_text.document())
+
     # ---------------------- Settings ----------------------
 
     def _open_settings(self) -> None:
         """Open settings dialog."""
-        dialog = SettingsDialog(self.settings, self)
-        dialog.settings_changed.connect(self._on_settings_changed)
-        dialog.exec()
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.settings, self)
+            self._settings_dialog.settings_changed.connect(self._on_settings_changed)
+        self._settings_dialog.exec()
 
     def _on_settings_changed(self) -> None:
         """Handle settings changes."""
@@ -493,19 +562,25 @@ class MainWindow(QMainWindow):
     # ---------------------- Helpers ----------------------
 
     def _append_log(self, text: str) -> None:
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.log_text.setTextCursor(cursor)
-        self.log_text.insertPlainText(text)
-        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
-
-    def _format_file_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        self._log_buffer.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        text = "".join(self._log_buffer)
+        self._log_buffer.clear()
+
+        # Only follow the tail if it was already shown
+        scrollbar = self.log_text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+
+        self._log_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._log_cursor.insertText(text)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     # ---------------------- Credentials ----------------------
 
@@ -520,139 +595,224 @@ class MainWindow(QMainWindow):
 
     # ---------------------- Source Management ----------------------
 
-    def _load_files_from_current_source(self) -> None:
+    def _load_files_from_current_source(self, force_refresh: bool = False) -> None:
+        self._log_buffer.clear()
         self.log_text.clear()
         self.search_bar.clear()
+        # The loaders below repopulate the table themselves
+        self._search_timer.stop()
 
         if self.current_source_type == "local":
-            self._load_local_files()
+            self._load_local_files(force_refresh)
         else:
-            self._load_drive_files()
-
-    def _load_local_files(self) -> None:
+            self._load_drive_files(force_refresh)
+
+    def _set_all_files(self, files: List[FileInfo]) -> None:
+        """Replace the loaded file list and rebuild the search index."""
+        self.all_files = files
+        names_lc = [f.name.lower() for f in files]
+        self._name_blob = "\n".join(names_lc) + "\n"
+        self._name_ends = list(accumulate(len(name) + 1 for name in names_lc))
+        self.filtered_indices = range(len(files))
+        self._last_needle = ""
+
+    def _load_local_files(self, force_refresh: bool = False) -> None:
         self._append_log(f"📂 Loading: {self.current_local_path}\n")
-        self.all_files = get_local_excel_files(self.current_local_path)
+        self._set_all_files(self._list_local_files(self.current_local_path, force_refresh))
+        # The listing may be reused from _local_cache, but files in it can
+        # have been edited in place since; re-stat them
+        self.file_model.clear_stat_cache()
 
         if not self.all_files:
             self._append_log("⚠️  No Excel files found\n")
         else:
             self._append_log(f"✓ Found {len(self.all_files)} file(s)\n")
 
-        self.filtered_files = self.all_files.copy()
         self._populate_table()
 
-    def _load_drive_files(self) -> None:
+    def _list_local_files(self, folder: str, force_refresh: bool = False) -> List[FileInfo]:
+        """
+        List Excel files in a local folder, reusing the previous listing
+        while the directory's mtime is unchanged (no files added/removed).
+        """
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            self._local_cache.pop(folder, None)
+            return []
+
+        cached = self._local_cache.get(folder)
+        if cached is not None and cached[0] == mtime and not force_refresh:
+            return cached[1]
+
+        files = get_local_excel_files(folder)
+        self._local_cache[folder] = (mtime, files)
+        return files
+
+    def _load_drive_files(self, force_refresh: bool = False) -> None:
         if not self.api_key or not self.folder_id:
             self._append_log("❌ Drive credentials not configured\n")
             QMessageBox.critical(self, "Error", "Drive credentials missing")
             return
 
-        try:
-            self._append_log("🔐 Authenticating...\n")
-            self.all_files = get_drive_excel_files(self.api_key, self.folder_id)
+        if self.drive_worker is not None:
+            self._append_log("⏳ Drive listing already in progress\n")
+            return
 
-            if not self.all_files:
-                self._append_log("⚠️  No files found\n")
-            else:
-                self._append_log(f"✓ Found {len(self.all_files)} file(s)\n")
+        # Show the last known listing right away; refresh it in the background
+        cached = metadata_cache.load(self.folder_id)
+        if cached is not None:
+            files, fetched_at = cached
+            self._set_all_files(files)
+            self._populate_table()
+            self._append_log(f"🗂️  {len(files)} file(s) from cached Drive listing\n")
 
-            self.filtered_files = self.all_files.copy()
+            if not force_refresh and time.time() - fetched_at < DRIVE_CACHE_TTL_SECONDS:
+                self._append_log("   (click ⟳ to refresh from Drive)\n")
+                return
+        else:
+            # Don't leave the previous source's files selectable while listing
+            self._set_all_files([])
             self._populate_table()
 
-        except Exception as e:
-            self._append_log(f"❌ Error: {e}\n")
-            QMessageBox.critical(self, "Error", str(e))
+        self._append_log("🔐 Authenticating...\n")
+        self.progress_container.show()
+        self.progress_bar.setRange(0, 0)  # busy indicator
+        self.progress_label.setText("Loading Drive files...")
+
+        self.drive_worker = DriveListWorker(
+            self.api_key, self.folder_id, drive_service=self._drive_service
+        )
+        self.drive_worker.files_ready.connect(self._on_drive_files_ready)
+        self.drive_worker.error.connect(self._on_drive_list_error)
+        self.drive_worker.finished.connect(self._on_drive_worker_finished)
+        self.drive_worker.start()
+
+    def _is_stale_drive_listing(self) -> bool:
+        """True if the user switched source/folder while the listing ran."""
+        return (
+            self.current_source_type == "local"
+            or self.drive_worker is None
+            or self.drive_worker.folder_id != self.folder_id
+        )
+
+    def _on_drive_files_ready(self, files: list) -> None:
+        self.progress_bar.setRange(0, 100)
+
+        if self._is_stale_drive_listing():
+            return
+
+        if files and files == self.all_files:
+            # Cached listing was current; keep the table (and any checks) as is
+            self._append_log("✓ Drive listing is up to date\n")
+            return
+
+        self._set_all_files(files)
+
+        if not self.all_files:
+            self._append_log("⚠️  No files found\n")
+        else:
+            self._append_log(f"✓ Found {len(self.all_files)} file(s)\n")
+
+        self._populate_table()
+
+    def _on_drive_list_error(self, message: str) -> None:
+        self.progress_bar.setRange(0, 100)
+
+        if self._is_stale_drive_listing():
+            return
+
+        if self.all_files:
+            # A background refresh failed; keep the cached listing (and checks)
+            self._append_log(
+                f"⚠️  Could not refresh Drive listing: {message}\n"
+                "   (showing cached listing)\n"
+            )
+            return
+
+        self._append_log(f"❌ Error: {message}\n")
+        QMessageBox.critical(self, "Error", message)
+
+    def _on_drive_worker_finished(self) -> None:
+        if self.drive_worker:
+            if self.drive_worker.api_key == self.api_key:
+                self._drive_service = self.drive_worker.drive_service
+            self.drive_worker.deleteLater()
+            self.drive_worker = None
+
+        self.progress_bar.setRange(0, 100)
+        # Leave the progress area alone if a processing run is using it
+        if self.worker is None:
+            self.progress_container.hide()
 
     # ---------------------- Search ----------------------
 
     def _on_search_changed(self, text: str) -> None:
-        search_text = text.strip().lower()
+        """Remember the search text and (re)start the debounce timer."""
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _apply_search(self) -> None:
+        search_text = self._pending_search.strip().lower()
+        if search_text == self._last_needle:
+            # e.g. whitespace-only edits, or clearing an already clear bar
+            return
+        self._last_needle = search_text
 
         if not search_text:
-            self.filtered_files = self.all_files.copy()
+            self.filtered_indices = range(len(self.all_files))
         else:
-            self.filtered_files = [
-                f for f in self.all_files
-                if search_text in f.name.lower()
-            ]
+            self.filtered_indices = self._find_matching_rows(search_text)
 
         self._populate_table()
 
+    def _find_matching_rows(self, needle: str) -> List[int]:
+        """
+        Return indices into all_files whose lower-cased name contains needle.
+
+        Scans the joined name blob with str.find (one C-level scan) and maps
+        each hit back to its row with bisect. After a hit the scan resumes
+        at the start of the next name, so every row is reported once.
+        """
+        blob = self._name_blob
+        ends = self._name_ends
+        rows: List[int] = []
+        if "\n" in needle:
+            # Names never contain the separator
+            return rows
+
+        pos = blob.find(needle)
+        while pos != -1:
+            row = bisect_right(ends, pos)
+            rows.append(row)
+            pos = blob.find(needle, ends[row])
+
+        return rows
+
     # ---------------------- Table Population ----------------------
 
     def _populate_table(self) -> None:
-        self.table.setRowCount(0)
-
-        for row_idx, file_info in enumerate(self.filtered_files):
-            self.table.insertRow(row_idx)
-
-            # Checkbox
-            chk_item = QTableWidgetItem()
-            chk_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            chk_item.setCheckState(Qt.CheckState.Unchecked)
-            chk_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 0, chk_item)
-
-            # File name
-            name_item = QTableWidgetItem(file_info.name)
-            name_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row_idx, 1, name_item)
-
-            # Source
-            source_text = "📁 Local" if file_info.source_type == "local" else "☁️  Drive"
-            source_item = QTableWidgetItem(source_text)
-            source_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 2, source_item)
-
-            # File size
-            if file_info.local_path and os.path.exists(file_info.local_path):
-                size = os.path.getsize(file_info.local_path)
-                size_text = self._format_file_size(size)
-            else:
-                size_text = "—"
-            size_item = QTableWidgetItem(size_text)
-            size_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 3, size_item)
-
-            # Modified date
-            if file_info.local_path and os.path.exists(file_info.local_path):
-                mtime = os.path.getmtime(file_info.local_path)
-                date_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
-            else:
-                date_str = "—"
-            date_item = QTableWidgetItem(date_str)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setForeground(QColor("#888"))
-            self.table.setItem(row_idx, 4, date_item)
-
-            # Status (empty initially)
-            status_item = QTableWidgetItem("")
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 5, status_item)
-
-        self.table.resizeRowsToContents()
+        self.file_model.set_files(self.all_files, self.filtered_indices)
 
     # ---------------------- Selection ----------------------
 
     def _select_all(self) -> None:
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
+        self.file_model.set_all_checked(True)
 
     def _deselect_all(self) -> None:
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        self.file_model.set_all_checked(False)
 
     # ---------------------- Open Output Folder ----------------------
 
     def _open_output_folder(self) -> None:
         """Open the DATA output folder in file explorer."""
-        from doc_validator.config import DATA_FOLDER
+        now = time.monotonic()
+        checked_at, exists = self._data_dir_cache
+        if now - checked_at >= 1.0:
+            exists = os.path.isdir(DATA_FOLDER)
+            self._data_dir_cache = (now, exists)
 
-        if not os.path.isdir(DATA_FOLDER):
+        if not exists:
             QMessageBox.warning(
                 self,
                 "Folder Not Found",
@@ -661,6 +821,9 @@ class MainWindow(QMainWindow):
             )
             return
 
+        import platform
+        import subprocess
+
         try:
             system = platform.system()
             if system == "Windows":
@@ -683,12 +846,10 @@ class MainWindow(QMainWindow):
         self._status_row_map = {}
 
         selected_files: List[FileInfo] = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                file_info = self.filtered_files[row]
-                selected_files.append(self.filtered_files[row])
-                self._status_row_map.setdefault(file_info.name, []).append(row)
+        for row in self.file_model.checked_rows():
+            file_info = self.all_files[self.filtered_indices[row]]
+            selected_files.append(file_info)
+            self._status_row_map.setdefault(file_info.name, []).append(row)
 
         if not selected_files:
             QMessageBox.warning(self, "No Selection", "Please select at least one file")
@@ -697,9 +858,7 @@ class MainWindow(QMainWindow):
         # Clear status for the rows that are about to be processed
         for rows in self._status_row_map.values():
             for row in rows:
-                status_item = self.table.item(row, 5)
-                if status_item:
-                    status_item.setText("")
+                self.file_model.set_status(row, "")
 
         self.btn_run.setEnabled(False)
 
@@ -719,8 +878,10 @@ class MainWindow(QMainWindow):
         self._append_log("\n" + "=" * 60 + "\n▶ Starting...\n" + "=" * 60 + "\n")
 
         self.progress_container.show()
+        self.progress_bar.setRange(0, 100)  # in case a Drive listing left it busy
         self.progress_bar.setValue(0)
         self.progress_label.setText("Starting...")
+        self._last_progress = (0, "Starting...")
 
         # ASC is always enabled now (removed checkbox)
         enable_asc = True
@@ -732,11 +893,14 @@ class MainWindow(QMainWindow):
             filter_start_date=filter_start,
             filter_end_date=filter_end,
             enable_action_step_control=enable_asc,
+            max_workers=min(8, len(selected_files)),
         )
 
-        self.worker.log_message.connect(self._append_log)
-        self.worker.progress_updated.connect(self._update_progress)
-        self.worker.finished_with_results.connect(self._on_processing_finished)
+        # Always cross-thread: skip AutoConnection's per-emit thread check
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker.log_message.connect(self._append_log, queued)
+        self.worker.progress_updated.connect(self._update_progress, queued)
+        self.worker.finished_with_results.connect(self._on_processing_finished, queued)
         self.worker.finished.connect(self._on_worker_thread_finished)
 
         self.worker.start()
@@ -747,10 +911,29 @@ class MainWindow(QMainWindow):
             self.worker = None
 
     def _update_progress(self, value: int, status: str) -> None:
-        self.progress_bar.setValue(value)
-        self.progress_label.setText(status)
+        self._pending_progress = (value, status)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        if self._pending_progress is None:
+            return
+        pending = self._pending_progress
+        self._pending_progress = None
+        if pending == self._last_progress:
+            return
+        value, status = pending
+        if value != self.progress_bar.value():
+            self.progress_bar.setValue(value)
+        if status != self.progress_label.text():
+            self.progress_label.setText(status)
+        self._last_progress = pending
 
     def _on_processing_finished(self, results: list) -> None:
+        # Drop any throttled update so it can't leak into the next run
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._last_progress = None
         self.progress_container.hide()
         self.btn_run.setEnabled(True)
 
@@ -762,24 +945,16 @@ class MainWindow(QMainWindow):
 
             rows = self._status_row_map.get(name, [])
             for row in rows:
-                status_item = self.table.item(row, 5)
-                if not status_item:
-                    continue
-
                 if result.get("output_file"):
-                    status_item.setText("✓ Success")
-                    status_item.setForeground(QColor("#4CAF50"))
+                    self.file_model.set_status(row, "✓ Success", "#4CAF50")
                 else:
-                    status_item.setText("✗ Failed")
-                    status_item.setForeground(QColor("#F44336"))
+                    self.file_model.set_status(row, "✗ Failed", "#F44336")
 
         # Summary
         success_count = sum(1 for r in results if r.get("output_file"))
         total = len(results)
         failed_count = total - success_count
 
-        from doc_validator.config import DATA_FOLDER
-
         if success_count == total:
             msg = f"✓ All {total} file(s) processed!"
         elif success_count > 0:
@@ -0,0 +1,8 @@
+# doc_validator/interface/models/__init__.py
+"""
+Qt item models for the AMOSFilter GUI.
+"""
+
+from .file_list_model import FileListModel
+
+__all__ = ["FileListModel"]
@@ -0,0 +1,234 @@
+# doc_validator/interface/models/file_list_model.py
+"""
+Table model for the MainWindow file list.
+
+The model reads straight from the FileInfo list, so no per-cell
+QTableWidgetItem objects are created. Qt only asks data() for the
+rows that are actually visible.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QIcon
+
+from doc_validator.core.input_source_manager import FileInfo
+
+
+COLUMN_HEADERS = ("", "File Name", "Source", "Size", "Modified", "Status")
+
+CHECK_COLUMN = 0
+NAME_COLUMN = 1
+MODIFIED_COLUMN = 4
+STATUS_COLUMN = 5
+
+HEADER_ICON_SIZE = 32
+
+_CENTERED = Qt.AlignmentFlag.AlignCenter
+
+
+def format_file_size(size_bytes: float) -> str:
+    """Format file size in human-readable format."""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f} TB"
+
+
+class FileListModel(QAbstractTableModel):
+    """
+    Checkable file list model.
+
+    Columns: checkbox, file name, source, size, modified date, status.
+    The model holds the full FileInfo list plus the indices of the rows
+    currently shown (a range when unfiltered). Check states are a uint8
+    mask aligned with the full list, so select/deselect all and
+    collecting the selection are single vectorized operations; statuses
+    live in a plain list aligned with the shown rows.
+    """
+
+    def __init__(self, parent=None, refresh_icon: Optional[QIcon] = None):
+        super().__init__(parent)
+        self._files: List[FileInfo] = []
+        self._rows: Sequence[int] = range(0)
+        self._row_index = np.zeros(0, dtype=np.intp)  # _rows as an array
+        self._checked = np.zeros(0, dtype=np.uint8)
+        self._status: List[Optional[Tuple[str, Optional[QColor]]]] = []
+        # local_path -> (size_text, date_text); stat once per file per load
+        self._stat_cache: dict[str, Tuple[str, str]] = {}
+
+        self._refresh_icon = refresh_icon
+        self._name_font = QFont("Segoe UI", 10)
+        self._muted = QColor("#888")
+
+        # Column -> DisplayRole reader (column 0 is check-state only)
+        self._col_readers = (
+            None,
+            lambda row, fi: fi.name,
+            lambda row, fi: "📁 Local" if fi.source_type == "local" else "☁️  Drive",
+            lambda row, fi: self._stat_texts(fi)[0],
+            lambda row, fi: self._stat_texts(fi)[1],
+            lambda row, fi: self._status[row][0] if self._status[row] else "",
+        )
+
+    # ------------------------------------------------------------------ #
+    # Qt model API
+    # ------------------------------------------------------------------ #
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            reader = self._col_readers[col]
+            return reader(row, self._files[self._rows[row]]) if reader else None
+
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if col == CHECK_COLUMN:
+                return Qt.CheckState.Checked if self._checked[self._rows[row]] else Qt.CheckState.Unchecked
+            return None
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return None if col == NAME_COLUMN else _CENTERED
+
+        if role == Qt.ItemDataRole.FontRole:
+            return self._name_font if col == NAME_COLUMN else None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col == MODIFIED_COLUMN:
+                return self._muted
+            if col == STATUS_COLUMN and self._status[row]:
+                return self._status[row][1]
+
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if (
+            not index.isValid()
+            or index.column() != CHECK_COLUMN
+            or role != Qt.ItemDataRole.CheckStateRole
+        ):
+            return False
+
+        self._checked[self._rows[index.row()]] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == CHECK_COLUMN:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return COLUMN_HEADERS[section]
+        if section == CHECK_COLUMN:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._refresh_icon
+            if role == Qt.ItemDataRole.SizeHintRole:
+                return QSize(HEADER_ICON_SIZE, HEADER_ICON_SIZE)
+        return None
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    def set_files(self, files: List[FileInfo], rows: Optional[Sequence[int]] = None) -> None:
+        """
+        Show files[i] for each i in rows (all files when rows is None).
+        Clears check states and statuses; the stat cache survives as long
+        as the same files list is passed back in (see clear_stat_cache()).
+        """
+        self.beginResetModel()
+        if files is not self._files:
+            self._stat_cache.clear()
+            self._checked = np.zeros(len(files), dtype=np.uint8)
+        else:
+            self._checked[:] = 0
+        self._files = files
+        self._rows = range(len(files)) if rows is None else rows
+        self._row_index = np.asarray(self._rows, dtype=np.intp)
+        self._status = [None] * len(self._rows)
+        self.endResetModel()
+
+    def clear_stat_cache(self) -> None:
+        """
+        Forget cached sizes / dates, so they are read again from disk.
+        A reused files list can still have files edited in place.
+        """
+        self._stat_cache.clear()
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, len(COLUMN_HEADERS) - 1)
+            )
+
+    def file_at(self, row: int) -> FileInfo:
+        return self._files[self._rows[row]]
+
+    def set_all_checked(self, checked: bool) -> None:
+        """Check or uncheck every row with a single dataChanged emit."""
+        count = len(self._rows)
+        if not count:
+            return
+        self._checked[self._row_index] = 1 if checked else 0
+        self.dataChanged.emit(
+            self.index(0, CHECK_COLUMN),
+            self.index(count - 1, CHECK_COLUMN),
+            [Qt.ItemDataRole.CheckStateRole],
+        )
+
+    def checked_rows(self) -> List[int]:
+        """Return row numbers of all checked rows, in display order."""
+        return np.flatnonzero(self._checked[self._row_index]).tolist()
+
+    def set_status(self, row: int, text: str, color: Optional[str] = None) -> None:
+        """Set the Status column text (and optional color) for one row."""
+        if not 0 <= row < len(self._rows):
+            return
+        self._status[row] = (text, QColor(color) if color else None) if text else None
+        index = self.index(row, STATUS_COLUMN)
+        self.dataChanged.emit(index, index)
+
+    # ------------------------------------------------------------------ #
+    # Helpers
+    # ------------------------------------------------------------------ #
+
+    def _stat_texts(self, file_info: FileInfo) -> Tuple[str, str]:
+        """Return (size_text, date_text), hitting the filesystem once per file."""
+        path = file_info.local_path
+        if not path:
+            return "—", "—"
+
+        cached = self._stat_cache.get(path)
+        if cached is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                cached = ("—", "—")
+            else:
+                cached = (
+                    format_file_size(st.st_size),
+                    datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M"),
+                )
+            self._stat_cache[path] = cached
+        return cached
@@ -60,6 +60,9 @@ class DateFilterPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
 
+        # One "today" for both defaults (consistent even across midnight)
+        today = QDate.currentDate()
+
         # Checkbox
         self.chk_enable = QCheckBox("📅 Date Filter:")
         self.chk_enable.setChecked(False)
@@ -68,7 +71,7 @@ class DateFilterPanel(QWidget):
 
         # From
         layout.addWidget(QLabel("From:"))
-        start_initial = QDate.currentDate().addMonths(-1)
+        start_initial = today.addMonths(-1)
         self.date_start = SmartDateLineEdit(start_initial)
         self.date_start.setEnabled(False)
         self.date_start.setFixedWidth(120)
@@ -76,7 +79,7 @@ class DateFilterPanel(QWidget):
 
         # To
         layout.addWidget(QLabel("To:"))
-        end_initial = QDate.currentDate()
+        end_initial = today
         self.date_end = SmartDateLineEdit(end_initial)
         self.date_end.setEnabled(False)
         self.date_end.setFixedWidth(120)
@@ -91,6 +94,9 @@ class DateFilterPanel(QWidget):
         layout.setContentsMargins(10, 8, 10, 8)
         layout.setSpacing(6)
 
+        # One "today" for both defaults (consistent even across midnight)
+        today = QDate.currentDate()
+
         # Title
         title = QLabel("📅 Date Filter (Optional)")
         title.setStyleSheet("color: #2196F3; font-weight: bold;")
@@ -108,12 +114,12 @@ class DateFilterPanel(QWidget):
         dates_row = QHBoxLayout()
 
         start_label = QLabel("From:")
-        start_initial = QDate.currentDate().addMonths(-1)
+        start_initial = today.addMonths(-1)
         self.date_start = SmartDateLineEdit(start_initial)
         self.date_start.setEnabled(False)
 
         end_label = QLabel("To:")
-        end_initial = QDate.currentDate()
+        end_initial = today
         self.date_end = SmartDateLineEdit(end_initial)
         self.date_end.setEnabled(False)
 
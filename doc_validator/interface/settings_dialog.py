@@ -17,16 +17,76 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QGroupBox,
     QCheckBox,
-    QFileDialog,
     QDialogButtonBox,
     QListWidget,
     QListWidgetItem,
-    QMessageBox,
 )
 
+from doc_validator.config import INPUT_FOLDER
 from doc_validator.interface.settings_manager import SettingsManager
 
 
+# Dialog style sheet, scoped by object name. MainWindow appends it to its
+# own sheet, which the dialog inherits as its child, so it is parsed once
+# with the window's theme rather than on every dialog construction.
+SETTINGS_DIALOG_QSS = """
+    QDialog#SettingsDialog {
+        background-color: #1a1a1a;
+        color: #e0e0e0;
+    }
+    QDialog#SettingsDialog QLabel,
+    QDialog#SettingsDialog QCheckBox {
+        color: #e0e0e0;
+    }
+    QDialog#SettingsDialog QPushButton,
+    QDialog#SettingsDialog QComboBox,
+    QDialog#SettingsDialog QLineEdit,
+    QDialog#SettingsDialog QListWidget {
+        background-color: #2a2a2a;
+        color: #e0e0e0;
+        border: 2px solid #444;
+        border-radius: 5px;
+        padding: 6px 8px;
+    }
+    QDialog#SettingsDialog QPushButton {
+        padding: 6px 12px;
+        min-height: 24px;
+    }
+    QDialog#SettingsDialog QPushButton:hover {
+        background-color: #333;
+        border-color: #2196F3;
+    }
+    QDialog#SettingsDialog QGroupBox {
+        border: 2px solid #444;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding: 15px 10px 10px 10px;
+        background-color: #2a2a2a;
+        font-weight: bold;
+        color: #2196F3;
+    }
+    QDialog#SettingsDialog QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QDialog#SettingsDialog QCheckBox {
+        spacing: 8px;
+    }
+    QDialog#SettingsDialog QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #666;
+        border-radius: 4px;
+        background-color: #2a2a2a;
+    }
+    QDialog#SettingsDialog QCheckBox::indicator:checked {
+        background-color: #2196F3;
+        border-color: #2196F3;
+    }
+"""
+
+
 class SettingsDialog(QDialog):
     """Settings dialog with tabs for different setting categories."""
 
@@ -35,12 +95,24 @@ class SettingsDialog(QDialog):
     def __init__(self, settings_manager: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings = settings_manager
+        self.setObjectName("SettingsDialog")  # SETTINGS_DIALOG_QSS scope
         self.setWindowTitle("Settings")
         self.setMinimumWidth(600)
         self.setMinimumHeight(500)
 
-        self._setup_ui()
+        # Widgets are built on first show; see showEvent()
+        self._ui_built = False
+        # Folder picker, created on first Browse click and reused
+        self._folder_dialog = None
+
+    def showEvent(self, event):
+        """Build the UI on first show and refresh it from settings each time."""
+        if not self._ui_built:
+            self._setup_ui()
+            self._ui_built = True
+        # The dialog may be reused; drop edits left over from a cancelled open
         self._load_current_settings()
+        super().showEvent(event)
 
     def _setup_ui(self):
         """Build the settings UI."""
@@ -80,77 +152,6 @@ class SettingsDialog(QDialog):
         )
         layout.addWidget(button_box)
 
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a1a;
-                color: #e0e0e0;
-            }
-            QGroupBox {
-                border: 2px solid #444;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding: 15px 10px 10px 10px;
-                background-color: #2a2a2a;
-                font-weight: bold;
-                color: #2196F3;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: 2px solid #444;
-                border-radius: 5px;
-                padding: 6px 12px;
-                min-height: 24px;
-            }
-            QPushButton:hover {
-                background-color: #333;
-                border-color: #2196F3;
-            }
-            QComboBox {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: 2px solid #444;
-                border-radius: 5px;
-                padding: 6px 8px;
-            }
-            QLineEdit {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: 2px solid #444;
-                border-radius: 5px;
-                padding: 6px 8px;
-            }
-            QListWidget {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: 2px solid #444;
-                border-radius: 5px;
-            }
-            QCheckBox {
-                color: #e0e0e0;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #666;
-                border-radius: 4px;
-                background-color: #2a2a2a;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #2196F3;
-                border-color: #2196F3;
-            }
-        """)
-
     def _create_input_source_section(self) -> QGroupBox:
         """Create input source settings section."""
         group = QGroupBox("📂 Input Source")
@@ -217,6 +218,8 @@ class SettingsDialog(QDialog):
             cb = QCheckBox(label)
             self.seq_checkboxes[pattern] = cb
             layout.addWidget(cb)
+        # (pattern, checkbox) pairs, fixed once built
+        self._seq_pattern_pairs = tuple(self.seq_checkboxes.items())
 
         group.setLayout(layout)
         return group
@@ -238,23 +241,23 @@ class SettingsDialog(QDialog):
         """Browse for local folder."""
         current = self.line_local_path.text()
         if not current:
-            from doc_validator.config import INPUT_FOLDER
             current = INPUT_FOLDER
 
-        folder = QFileDialog.getExistingDirectory(
-            self,
-            "Select Input Folder",
-            current,
-            QFileDialog.Option.ShowDirsOnly
-        )
+        from PyQt6.QtWidgets import QFileDialog
+
+        if self._folder_dialog is None:
+            self._folder_dialog = QFileDialog(self, "Select Input Folder")
+            self._folder_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._folder_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        self._folder_dialog.setDirectory(current)
 
-        if folder:
-            self.line_local_path.setText(folder)
+        if self._folder_dialog.exec():
+            folder = self._folder_dialog.selectedFiles()[0]
+            if folder:
+                self.line_local_path.setText(folder)
 
     def _load_current_settings(self):
         """Load current settings into UI."""
-        from doc_validator.config import INPUT_FOLDER
-
         # Input source
         source_type = self.settings.get("input_source_type", "local")
         index = self.combo_source.findData(source_type)
@@ -269,7 +272,7 @@ class SettingsDialog(QDialog):
 
         # SEQ patterns
         patterns = self.settings.get("seq_auto_valid_patterns", ["1.", "2.", "3.", "10."])
-        for pattern, checkbox in self.seq_checkboxes.items():
+        for pattern, checkbox in self._seq_pattern_pairs:
             checkbox.setChecked(pattern in patterns)
 
         # Update UI based on source type
@@ -277,24 +280,26 @@ class SettingsDialog(QDialog):
 
     def _save_and_close(self):
         """Save settings and close dialog."""
-        from doc_validator.config import INPUT_FOLDER
-
-        # Save input source
+        # Input source
         source_type = self.combo_source.currentData()
-        self.settings.set("input_source_type", source_type)
 
-        # Save local path - ensure it's never empty
+        # Local path - ensure it's never empty
         local_path = self.line_local_path.text().strip()
         if not local_path:
             local_path = INPUT_FOLDER
-        self.settings.set("input_local_path", local_path)
 
-        # Save SEQ patterns
+        # SEQ patterns
         patterns = [
-            pattern for pattern, cb in self.seq_checkboxes.items()
+            pattern for pattern, cb in self._seq_pattern_pairs
             if cb.isChecked()
         ]
-        self.settings.set("seq_auto_valid_patterns", patterns)
+
+        # One write for all three
+        self.settings.set_many({
+            "input_source_type": source_type,
+            "input_local_path": local_path,
+            "seq_auto_valid_patterns": patterns,
+        })
 
         # Emit signal
         self.settings_changed.emit()
@@ -303,6 +308,8 @@ class SettingsDialog(QDialog):
 
     def _restore_defaults(self):
         """Restore default settings."""
+        from PyQt6.QtWidgets import QMessageBox
+
         reply = QMessageBox.question(
             self,
             "Restore Defaults",
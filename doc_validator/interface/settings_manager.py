@@ -4,19 +4,56 @@ Settings Manager with JSON persistence.
 Handles saving/loading all user preferences.
 """
 
+import atexit
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from doc_validator.config import INPUT_FOLDER
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data to path atomically: a crash mid-write leaves the old file."""
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
 
 class SettingsManager:
-    """Manages application settings with JSON persistence."""
+    """
+    Manages application settings with JSON persistence.
+
+    set() doesn't write immediately: the file is rewritten once,
+    SAVE_DELAY_SECONDS after the first unsaved change, so bursts of
+    set() calls cost a single write. flush() writes right away and runs
+    at interpreter exit as well.
+    """
+
+    SAVE_DELAY_SECONDS = 0.25
 
     # Default settings will be populated dynamically
     DEFAULT_SETTINGS = {
         # Input source settings
         "input_source_type": "local",  # "local" or "drive"
-        "input_local_path": None,  # Will be set to INPUT_FOLDER from config
+        "input_local_path": INPUT_FOLDER,
 
         # SEQ auto-valid patterns
         "seq_auto_valid_patterns": ["1.", "2.", "3.", "10."],
@@ -39,34 +76,32 @@ class SettingsManager:
         """
         if config_path is None:
             # Store settings in user's home directory
-            config_dir = Path.home() / ".amos_validator"
-            config_dir.mkdir(exist_ok=True)
-            self.config_path = config_dir / "settings.json"
+            # (the folder is created by the first save())
+            self.config_path = Path.home() / ".amos_validator" / "settings.json"
         else:
             self.config_path = Path(config_path)
 
         self._settings: Dict[str, Any] = {}
+        # Guards _settings/_dirty/_save_timer and the file write; the
+        # delayed save runs on a timer thread
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._parent_ensured = False
         self.load()
+        atexit.register(self.flush)
 
     def load(self) -> None:
         """Load settings from file. Uses defaults if file doesn't exist."""
-        # Import here to avoid circular dependency
-        from doc_validator.config import INPUT_FOLDER
-
-        # Set default input path if not already set
-        if self.DEFAULT_SETTINGS["input_local_path"] is None:
-            self.DEFAULT_SETTINGS["input_local_path"] = INPUT_FOLDER
-
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    # Merge with defaults to handle new settings
-                    self._settings = {**self.DEFAULT_SETTINGS, **loaded}
+                loaded = _read_json(self.config_path)
+                # Merge with defaults to handle new settings
+                self._settings = {**self.DEFAULT_SETTINGS, **loaded}
 
-                    # If loaded settings don't have input_local_path, set it
-                    if not self._settings.get("input_local_path"):
-                        self._settings["input_local_path"] = INPUT_FOLDER
+                # If loaded settings don't have input_local_path, set it
+                if not self._settings.get("input_local_path"):
+                    self._settings["input_local_path"] = INPUT_FOLDER
 
             except Exception as e:
                 print(f"Warning: Could not load settings: {e}")
@@ -80,21 +115,48 @@ class SettingsManager:
 
     def save(self) -> None:
         """Save current settings to file."""
-        try:
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        with self._lock:
+            self._cancel_pending_save()
+            self._dirty = False
+            try:
+                if not self._parent_ensured:
+                    self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._parent_ensured = True
+                # Only values that differ from the defaults are stored;
+                # load() merges the file back over DEFAULT_SETTINGS
+                diff = {
+                    k: v for k, v in self._settings.items()
+                    if self.DEFAULT_SETTINGS.get(k) != v
+                }
+                _write_json(self.config_path, diff)
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+
+    def flush(self) -> None:
+        """Write pending changes to disk now, if there are any."""
+        with self._lock:
+            if self._dirty:
+                self.save()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
         return self._settings.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set a setting value and save."""
-        self._settings[key] = value
-        self.save()
+        """Set a setting value; it is saved shortly after (see flush())."""
+        with self._lock:
+            self._settings[key] = value
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY_SECONDS, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """Set several values and save them with a single write."""
+        with self._lock:
+            self._settings.update(values)
+            self.save()
 
     def get_all(self) -> Dict[str, Any]:
         """Get all settings as a dictionary."""
@@ -102,5 +164,11 @@ class SettingsManager:
 
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
-        self._settings = self.DEFAULT_SETTINGS.copy()
-        self.save()
\ No newline at end of file
+        with self._lock:
+            self._settings = self.DEFAULT_SETTINGS.copy()
+            self.save()
+
+    def _cancel_pending_save(self) -> None:
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
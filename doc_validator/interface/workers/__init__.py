@@ -3,6 +3,7 @@
 Background worker threads for the AMOSFilter GUI.
 """
 
+from .drive_list_worker import DriveListWorker
 from .processing_worker import ProcessingWorker
 
-__all__ = ["ProcessingWorker"]
\ No newline at end of file
+__all__ = ["DriveListWorker", "ProcessingWorker"]
\ No newline at end of file
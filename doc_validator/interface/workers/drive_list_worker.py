@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal, QObject
+
+from doc_validator.core import metadata_cache
+from doc_validator.core.drive_io import authenticate_drive_api
+from doc_validator.core.input_source_manager import get_drive_excel_files
+
+
+# ---------------------------------------------------------------------
+# Worker thread to list the Excel files in a Drive folder
+# ---------------------------------------------------------------------
+
+
+class DriveListWorker(QThread):
+    """
+    Background worker that authenticates against Drive, lists the Excel
+    files in a folder and stores the listing in the metadata cache, so
+    the GUI stays responsive meanwhile.
+    """
+
+    files_ready = pyqtSignal(list)  # List[FileInfo]
+    error = pyqtSignal(str)
+
+    def __init__(
+            self,
+            api_key: str,
+            folder_id: str,
+            drive_service=None,
+            parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self.api_key = api_key
+        self.folder_id = folder_id
+        # Reused if given; otherwise built in run() and left here for the
+        # caller to keep for the next listing
+        self.drive_service = drive_service
+
+    def run(self) -> None:
+        try:
+            if self.drive_service is None:
+                self.drive_service = authenticate_drive_api(self.api_key)
+            files = get_drive_excel_files(
+                self.api_key, self.folder_id, drive_service=self.drive_service
+            )
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        # Listing failures raise above, so an empty list is an empty folder
+        metadata_cache.save(self.folder_id, files)
+        self.files_ready.emit(files)
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 import sys
+import threading
+from collections import deque
 
-from PyQt6.QtCore import QThread, pyqtSignal, QObject, Qt
+from PyQt6.QtCore import QThread, pyqtSignal, QObject
 
 from doc_validator.core.drive_io import (
     authenticate_drive_api,
     download_file_from_drive,
 )
-from doc_validator.core.excel_pipeline import process_excel
 from doc_validator.core.input_source_manager import FileInfo
 
 
@@ -20,34 +22,111 @@ from doc_validator.core.input_source_manager import FileInfo
 # ---------------------------------------------------------------------
 
 
-class LogEmitter(QObject):
-    message = pyqtSignal(str)
-
-
 class EmittingStream:
     """
-    A file-like stream that sends written text to a Qt signal.
+    A file-like stream that passes written text to a callback.
     Used to capture print() output from existing code and mirror it
     into the GUI log window, while still printing to real stdout.
+
+    Only threads registered with capture_current_thread() are mirrored;
+    prints from any other thread (the GUI's included) go straight to
+    the original stream, although sys.stdout is replaced process-wide.
+
+    Writes are buffered until a line is complete (or flush() is called)
+    and then handed over in one call: print() issues a write per
+    argument plus one for the newline, so each printed line is one GUI
+    signal. The GUI coalesces those itself. The callback runs on
+    whichever thread wrote the text.
+
+    The GUI copy is also thinned: a line repeated more than REPEAT_LIMIT
+    times in a row is replaced by a count, and a single hand-over keeps
+    only its last MAX_LINES_PER_EMIT lines. The original stream still
+    gets everything.
     """
 
-    def __init__(self, emitter: LogEmitter, original_stream):
-        self.emitter = emitter
+    REPEAT_LIMIT = 3
+    MAX_LINES_PER_EMIT = 1000
+
+    def __init__(self, sink: Callable[[str], None], original_stream):
+        self.sink = sink
         self.original_stream = original_stream
+        # Download threads print too
+        self._lock = threading.Lock()
+        self._thread_ids: set = set()
+        self._buffer: List[str] = []
+        self._last_line: Optional[str] = None
+        self._repeats = 0  # times _last_line came again right after itself
+
+    def capture_current_thread(self) -> None:
+        """Mirror this thread's writes to the sink from now on."""
+        self._thread_ids.add(threading.get_ident())
 
     def write(self, text: str):
         if not text:
             return
-        # Emit to GUI
-        self.emitter.message.emit(text)
+        if threading.get_ident() not in self._thread_ids:
+            if self.original_stream is not None:
+                self.original_stream.write(text)
+            return
+        with self._lock:
+            self._buffer.append(text)
+            if "\n" in text:
+                self._emit_buffer()
         # Also forward to the original stream so IDE / console still see it
         if self.original_stream is not None:
             self.original_stream.write(text)
 
     def flush(self):
+        with self._lock:
+            self._emit_buffer(final=True)
         if self.original_stream is not None:
             self.original_stream.flush()
 
+    def _emit_buffer(self, final: bool = False) -> None:
+        # Caller holds _lock. final also closes off a pending repeat count.
+        if self._buffer or final:
+            text = self._thin("".join(self._buffer), final)
+            self._buffer.clear()
+            if text:
+                self.sink(text)
+
+    def _thin(self, text: str, final: bool) -> str:
+        """Apply the repeat and per-emit line limits to text."""
+        lines: deque = deque(maxlen=self.MAX_LINES_PER_EMIT)
+        dropped = 0
+
+        def keep(line: str) -> None:
+            nonlocal dropped
+            if not line:
+                return
+            if len(lines) == lines.maxlen:
+                dropped += 1
+            lines.append(line)
+
+        for line in text.splitlines(keepends=True):
+            if line == self._last_line:
+                self._repeats += 1
+                if self._repeats > self.REPEAT_LIMIT:
+                    continue
+            else:
+                keep(self._repeat_note())
+                self._last_line = line
+                self._repeats = 0
+            keep(line)
+        if final:
+            keep(self._repeat_note())
+
+        note = f"... {dropped} lines not shown ...\n" if dropped else ""
+        return note + "".join(lines)
+
+    def _repeat_note(self) -> str:
+        """Count line for repeats suppressed so far, or "" if none."""
+        extra = self._repeats - self.REPEAT_LIMIT
+        if extra <= 0:
+            return ""
+        self._repeats = self.REPEAT_LIMIT
+        return f"   [last line repeated {extra} more times]\n"
+
 
 # ---------------------------------------------------------------------
 # Worker thread to process selected files
@@ -74,6 +153,7 @@ class ProcessingWorker(QThread):
             filter_start_date: Optional[date] = None,
             filter_end_date: Optional[date] = None,
             enable_action_step_control: bool = True,
+            max_workers: int = 8,
             parent: Optional[QObject] = None,
     ):
 
@@ -84,10 +164,15 @@ class ProcessingWorker(QThread):
         self.filter_start_date = filter_start_date
         self.filter_end_date = filter_end_date
         self.enable_action_step_control = enable_action_step_control
+        # Concurrent Drive downloads; processing itself stays sequential
+        self.max_workers = max(1, max_workers)
 
         self._cancelled = False
-        self._line_count = 0
-        self._estimated_lines_per_file = 50
+        # One HTTP connection per download thread (httplib2 isn't thread-safe)
+        self._thread_local = threading.local()
+        self._last_progress = (-1, "")
+        # Set while run() redirects stdout; see _log()
+        self._stream: Optional[EmittingStream] = None
 
     # ------------------------------------------------------------------
     # Public control API
@@ -101,32 +186,88 @@ class ProcessingWorker(QThread):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _emit_log_and_count(self, message: str) -> None:
+    def _emit_progress(self, pct: int, status: str) -> None:
         """
-        Emit log message and update progress estimate based on line count.
+        Emit progress_updated only when the percentage or status changes.
+
+        This bounds worker -> GUI progress traffic to about 101 queued
+        signals plus one per status change (i.e. per file) per run, no
+        matter how many log lines are produced.
         """
-        if not message:
+        if (pct, status) == self._last_progress:
             return
+        self._last_progress = (pct, status)
+        self.progress_updated.emit(pct, status)
+
+    def _emit_log(self, message: str) -> None:
+        """Emit a log message to the GUI."""
+        if message:
+            self.log_message.emit(message)
+
+    def _log(self, message: str) -> None:
+        """
+        Log a message from run().
+
+        Buffered print() output goes out first, so the GUI log keeps the
+        order in which things were written.
+        """
+        if self._stream is not None:
+            self._stream.flush()
+        self._emit_log(message)
 
-        self.log_message.emit(message)
+    def _thread_http(self):
+        """
+        This thread's own httplib2.Http for media downloads; never the
+        service's http, which carries the on-disk listing cache.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            from googleapiclient.http import build_http
 
-        # Count lines in this message
-        lines = message.count("\n")
-        if message and not message.endswith("\n"):
-            lines += 1
-        self._line_count += lines
+            http = self._thread_local.http = build_http()
+        return http
+
+    def _download_drive_file(self, drive_service, file_info: FileInfo) -> Optional[str]:
+        """
+        Download one Drive file on a pool thread; returns local path or None.
 
-        # Estimate progress percentage
-        total_files = len(self.selected_files)
-        if total_files > 0:
-            estimated_total_lines = total_files * self._estimated_lines_per_file
-            progress = min(99, int((self._line_count / estimated_total_lines) * 100))
-        else:
-            progress = 0
+        The shared service only builds the request; the download runs on
+        this thread's own keep-alive connection, reused for its next files.
+        """
+        if self._cancelled:
+            return None
+        try:
+            return download_file_from_drive(
+                drive_service,
+                file_info.file_id,
+                "temp_gui",
+                file_info.name,
+                http=self._thread_http(),
+            )
+        except Exception as e:
+            print(f"   ❌ Error downloading {file_info.name}: {e}")
+            return None
+
+    def _start_drive_downloads(
+            self, executor: ThreadPoolExecutor, drive_service
+    ) -> Dict[str, Future]:
+        """
+        Submit every selected Drive file to the download pool.
 
-        # Extract first line as a short status text
-        status = message.split("\n")[0].strip()[:60] or "Processing..."
-        self.progress_updated.emit(progress, status)
+        Only the first file of each name is prefetched: they all land in
+        the same temp folder, so a same-named file is downloaded inline at
+        its turn, after its predecessor has been processed.
+        """
+        downloads: Dict[str, Future] = {}
+        seen_names = set()
+        for file_info in self.selected_files:
+            if file_info.source_type != "drive" or file_info.name in seen_names:
+                continue
+            seen_names.add(file_info.name)
+            downloads[file_info.file_id] = executor.submit(
+                self._download_drive_file, drive_service, file_info
+            )
+        return downloads
 
     # ------------------------------------------------------------------
     # QThread.run
@@ -136,41 +277,58 @@ class ProcessingWorker(QThread):
         """
         Run in the background thread.
         """
-        results: List[Dict[str, Any]] = []
+        # Imported here so pandas/openpyxl load on the first run, not at GUI startup
+        from doc_validator.core.excel_pipeline import process_excel
+
+        # One slot per selected file, filled in order; slots left empty
+        # by a cancel or error are dropped before emitting
+        results: List[Optional[Dict[str, Any]]] = [None] * len(self.selected_files)
 
         # Redirect stdout so all prints from process_excel() show up in GUI
         original_stdout = sys.stdout
         original_stderr = sys.stderr
-        emitter = LogEmitter()
-        stream = EmittingStream(emitter, original_stdout)
-        emitter.message.connect(self._emit_log_and_count, Qt.ConnectionType.QueuedConnection)
+        stream = EmittingStream(self._emit_log, original_stdout)
+        stream.capture_current_thread()
         sys.stdout = stream
         sys.stderr = stream
+        self._stream = stream
+
+        executor: Optional[ThreadPoolExecutor] = None
+        downloads: Dict[str, Future] = {}
 
         try:
             # Check if we need Drive authentication
-            need_drive = any(f.source_type == "drive" for f in self.selected_files)
+            drive_count = sum(1 for f in self.selected_files if f.source_type == "drive")
+            need_drive = drive_count > 0
             drive_service = None
 
             if need_drive:
                 if not self.api_key or not self.folder_id:
-                    self._emit_log_and_count(
+                    self._log(
                         "❌ ERROR: Drive files selected but credentials not configured.\n"
                     )
                     return
 
-                self._emit_log_and_count("Authenticating with Google Drive API...\n")
-                self.progress_updated.emit(5, "Authenticating...")
+                self._log("Authenticating with Google Drive API...\n")
+                self._emit_progress(5, "Authenticating...")
                 drive_service = authenticate_drive_api(self.api_key)
-                self._emit_log_and_count("✓ Authentication successful.\n\n")
-                self.progress_updated.emit(10, "Authentication successful")
+                self._log("✓ Authentication successful.\n\n")
+                self._emit_progress(10, "Authentication successful")
+
+                # Fetch Drive files in the background while earlier files process
+                executor = ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, drive_count),
+                    thread_name_prefix="drive-download",
+                    initializer=stream.capture_current_thread,
+                )
+                downloads = self._start_drive_downloads(executor, drive_service)
 
             total = len(self.selected_files)
-            self._emit_log_and_count(f"Processing {total} selected file(s)...\n")
+            self._log(f"Processing {total} selected file(s)...\n")
 
             for idx, file_info in enumerate(self.selected_files, start=1):
                 if self._cancelled:
-                    self._emit_log_and_count("\n⚠️ Processing cancelled by user.\n")
+                    self._log("\n⚠️ Processing cancelled by user.\n")
                     break
 
                 # Update progress
@@ -178,10 +336,10 @@ class ProcessingWorker(QThread):
                     pct = int(10 + (idx - 1) / total * 85)
                 else:
                     pct = 10
-                self.progress_updated.emit(pct, f"[{idx}/{total}] {file_info.name}")
+                self._emit_progress(pct, f"[{idx}/{total}] {file_info.name}")
 
                 # Nice separator
-                self._emit_log_and_count(
+                self._log(
                     "\n" + "=" * 60 + "\n"
                     + f"[{idx}/{total}] {file_info.name}\n"
                     + "=" * 60 + "\n"
@@ -193,88 +351,98 @@ class ProcessingWorker(QThread):
                 if file_info.source_type == "local":
                     # Local file - already have path
                     local_path = file_info.local_path
-                    self._emit_log_and_count(f"Local file: {local_path}\n")
+                    self._log(f"Local file: {local_path}\n")
 
                 elif file_info.source_type == "drive":
                     # Drive file - need to download
                     if not drive_service:
-                        self._emit_log_and_count(
+                        self._log(
                             "✗ ERROR: Drive service not initialized\n"
                         )
-                        results.append({
+                        results[idx - 1] = {
                             "source_name": file_info.name,
                             "source_id": file_info.file_id,
                             "local_path": None,
                             "output_file": None,
-                        })
+                        }
                         continue
 
-                    self._emit_log_and_count(f"Downloading from Drive...\n")
-                    wp_placeholder = "temp_gui"
-                    local_path = download_file_from_drive(
-                        drive_service,
-                        file_info.file_id,
-                        wp_placeholder,
-                        file_info.name,
-                    )
+                    self._log(f"Downloading from Drive...\n")
+                    pending = downloads.pop(file_info.file_id, None)
+                    if pending is not None:
+                        local_path = pending.result()
+                    else:
+                        wp_placeholder = "temp_gui"
+                        local_path = download_file_from_drive(
+                            drive_service,
+                            file_info.file_id,
+                            wp_placeholder,
+                            file_info.name,
+                            http=self._thread_http(),
+                        )
 
                     if not local_path:
-                        self._emit_log_and_count(
+                        self._log(
                             f"✗ Failed to download file: {file_info.name}\n"
                         )
-                        results.append({
+                        results[idx - 1] = {
                             "source_name": file_info.name,
                             "source_id": file_info.file_id,
                             "local_path": None,
                             "output_file": None,
-                        })
+                        }
                         continue
 
-                    self._emit_log_and_count(f"Downloaded to: {local_path}\n")
+                    self._log(f"Downloaded to: {local_path}\n")
 
-                # Process the Excel file
+                # Process the Excel file; its steps fill this file's share
+                # of the 10-95% band
+                status = f"[{idx}/{total}] {file_info.name}"
                 output_file = process_excel(
                     local_path,
                     filter_start_date=self.filter_start_date,
                     filter_end_date=self.filter_end_date,
                     enable_action_step_control=self.enable_action_step_control,
+                    progress_callback=lambda frac: self._emit_progress(
+                        int(10 + (idx - 1 + frac) / total * 85), status
+                    ),
                 )
 
                 if output_file:
-                    self._emit_log_and_count(
+                    self._log(
                         f"✓ Processing finished for {file_info.name}\n"
                         f"  Output: {output_file}\n"
                     )
                 else:
-                    self._emit_log_and_count(
+                    self._log(
                         f"✗ Processing failed for {file_info.name}\n"
                     )
 
-                results.append({
+                results[idx - 1] = {
                     "source_name": file_info.name,
                     "source_id": file_info.file_id if file_info.source_type == "drive" else None,
                     "local_path": local_path,
                     "output_file": output_file,
-                })
+                }
 
             if not self._cancelled:
-                self._emit_log_and_count("\n✓ All selected files have been processed.\n")
-                self.progress_updated.emit(100, "Complete!")
+                self._log("\n✓ All selected files have been processed.\n")
+                self._emit_progress(100, "Complete!")
 
         except Exception as exc:
             import traceback
-            self._emit_log_and_count(f"\n✗ ERROR: {exc!r}\n")
-            self._emit_log_and_count(traceback.format_exc())
+            self._log(f"\n✗ ERROR: {exc!r}\n")
+            self._log(traceback.format_exc())
         finally:
-            # Restore stdout/stderr
+            if executor is not None:
+                # Drop downloads that never started (cancel / error)
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            # Restore stdout/stderr, sending whatever is still buffered
+            stream.flush()
+            self._stream = None
             sys.stdout = original_stdout
             sys.stderr = original_stderr
 
-            # Disconnect signal
-            try:
-                emitter.message.disconnect(self._emit_log_and_count)
-            except:
-                pass
-
             # Emit final results
-            self.finished_with_results.emit(results)
\ No newline at end of file
+            self.finished_with_results.emit([r for r in results if r is not None])
\ No newline at end of file
@@ -0,0 +1,176 @@
+# doc_validator/tests/test_excel_io.py
+"""
+Tests for the openpyxl writers in core/excel_io.py:
+
+- _excel_value() converts cells the way DataFrame.to_excel() does
+- _write_sheet() round-trips a DataFrame through a write-only workbook
+- _append_logbook_row() numbers rows and refuses a mismatched header
+
+Run with:
+    python -m doc_validator.tests.test_excel_io
+"""
+
+import math
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+from doc_validator.core.excel_io import _append_logbook_row, _excel_value, _write_sheet
+
+
+class TestResults:
+    """Simple test result tracker"""
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.failures = []
+
+    def assert_equal(self, actual, expected, test_name):
+        if actual == expected:
+            self.passed += 1
+            print(f"✓ {test_name}")
+        else:
+            self.failed += 1
+            msg = f"✗ {test_name}: expected '{expected}', got '{actual}'"
+            self.failures.append(msg)
+            print(msg)
+
+    def print_summary(self):
+        print("\n" + "=" * 60)
+        print(f"PASSED: {self.passed}")
+        print(f"FAILED: {self.failed}")
+        if self.failures:
+            print("\nFailures:")
+            for f in self.failures:
+                print(f"  {f}")
+        print("=" * 60)
+        return self.failed == 0
+
+
+results = TestResults()
+
+
+def test_excel_value():
+    """Missing values, numpy scalars, infinities and dates"""
+    print("\n=== Testing _excel_value() ===")
+
+    sheet = Workbook(write_only=True).create_sheet("S")
+
+    for value in (None, float("nan"), pd.NA, pd.NaT, np.nan):
+        results.assert_equal(_excel_value(sheet, value), "", f"{value!r} -> empty")
+
+    converted = _excel_value(sheet, np.int64(7))
+    results.assert_equal((converted, type(converted)), (7, int), "numpy int -> int")
+    converted = _excel_value(sheet, np.float32(1.5))
+    results.assert_equal((converted, type(converted)), (1.5, float), "numpy float -> float")
+    converted = _excel_value(sheet, np.bool_(True))
+    results.assert_equal((converted, type(converted)), (True, bool), "numpy bool -> bool")
+    results.assert_equal(_excel_value(sheet, math.inf), "inf", "inf -> 'inf'")
+    results.assert_equal(_excel_value(sheet, -math.inf), "-inf", "-inf -> '-inf'")
+    results.assert_equal(_excel_value(sheet, "N/A"), "N/A", "Text unchanged")
+    results.assert_equal(_excel_value(sheet, ["a", 1]), "['a', 1]", "Other objects -> str")
+
+    cell = _excel_value(sheet, datetime(2024, 5, 1, 8, 30))
+    results.assert_equal(cell.number_format, "YYYY-MM-DD HH:MM:SS", "datetime format")
+    cell = _excel_value(sheet, date(2024, 5, 1))
+    results.assert_equal(cell.number_format, "YYYY-MM-DD", "date format")
+    cell = _excel_value(sheet, timedelta(hours=12))
+    results.assert_equal((cell.value, cell.number_format), (0.5, "0"), "timedelta -> days")
+
+
+def test_write_sheet_round_trip():
+    """Header row, values and auto filter of a written sheet"""
+    print("\n=== Testing _write_sheet() ===")
+
+    df = pd.DataFrame({
+        "WO": ["1001", "1002", None],
+        "SEQ": [1, 2, 3],
+        "Reason": pd.Categorical(["Valid", "Missing revision", "Valid"]),
+    })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.xlsx")
+        workbook = Workbook(write_only=True)
+        _write_sheet(workbook, "REF REV", df)
+        _write_sheet(workbook, "Empty", df.iloc[0:0])
+        workbook.save(path)
+
+        written = load_workbook(path)
+        sheet = written["REF REV"]
+        rows = [[cell.value for cell in row] for row in sheet.iter_rows()]
+        results.assert_equal(
+            rows,
+            [
+                ["WO", "SEQ", "Reason"],
+                ["1001", 1, "Valid"],
+                ["1002", 2, "Missing revision"],
+                [None, 3, "Valid"],
+            ],
+            "Header and values",
+        )
+        results.assert_equal(sheet.auto_filter.ref, "A1:C4", "Auto filter range")
+        results.assert_equal(written.sheetnames, ["REF REV", "Empty"], "Sheet order")
+        results.assert_equal(written["Empty"].auto_filter.ref, "A1:C1", "Empty sheet filter")
+
+
+def test_append_logbook_row():
+    """Order counts the runs already logged; other headers are refused"""
+    print("\n=== Testing _append_logbook_row() ===")
+
+    header = ["Order", "WP", "Total rows"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "logbook.xlsx")
+        workbook = Workbook()
+        workbook.active.append(header)
+        workbook.active.append([1, "WP-A", 10])
+        workbook.save(path)
+
+        row = {"Order": None, "WP": "WP-B", "Total rows": 20}
+        results.assert_equal(_append_logbook_row(path, row), True, "Row appended")
+        results.assert_equal(row["Order"], 2, "Order set on the row")
+
+        _append_logbook_row(path, {"Order": None, "WP": "WP-C", "Total rows": 30})
+        rows = [list(r) for r in load_workbook(path).active.iter_rows(values_only=True)]
+        results.assert_equal(
+            rows,
+            [header, [1, "WP-A", 10], [2, "WP-B", 20], [3, "WP-C", 30]],
+            "Logbook contents",
+        )
+
+        other = {"Order": None, "WP": "WP-D", "Processing time": 1.0}
+        results.assert_equal(_append_logbook_row(path, other), False, "Other header refused")
+        results.assert_equal(
+            load_workbook(path).active.max_row, 4, "Nothing written when refused"
+        )
+
+
+def run_all_tests():
+    """Run all test suites"""
+    print("=" * 60)
+    print("EXCEL WRITER TEST SUITE")
+    print("=" * 60)
+
+    test_excel_value()
+    test_write_sheet_round_trip()
+    test_append_logbook_row()
+
+    success = results.print_summary()
+
+    if success:
+        print("\n🎉 ALL TESTS PASSED!")
+        return 0
+    else:
+        print("\n❌ SOME TESTS FAILED - Please review")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+
+    exit_code = run_all_tests()
+    sys.exit(exit_code)
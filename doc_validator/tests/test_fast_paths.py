@@ -0,0 +1,234 @@
+# doc_validator/tests/test_fast_paths.py
+"""
+Equivalence tests for the validation fast paths:
+
+- search_ignorecase() vs. a plain IGNORECASE search
+- may_have_reference() never rejecting text has_any_reference() accepts
+- check_ref_keywords_batch() vs. check_ref_keywords() row by row,
+  including NA and unhashable cell values
+
+Run with:
+    python -m doc_validator.tests.test_fast_paths
+"""
+
+import pandas as pd
+
+from doc_validator.validation.engine import check_ref_keywords, check_ref_keywords_batch
+from doc_validator.validation.helpers import (
+    ANY_REFERENCE_PATTERN,
+    IAW_KEYWORD_PATTERN,
+    REF_KEYWORD_PATTERN,
+    _REV_WINDOW_RE,
+    has_any_reference,
+    may_have_reference,
+)
+from doc_validator.validation.patterns import (
+    B787_DOC_PATTERN,
+    DATA_MODULE_TASK_PATTERN,
+    DATA_MODULE_TASK_TEXT,
+    DMC_PATTERN,
+    DOC_ID_PATTERN,
+    NDT_REPORT_PATTERN,
+    REFERENCED_PATTERN,
+    REVISION_ANY_PATTERN,
+    SB_FULL_PATTERN,
+    search_ignorecase,
+)
+
+
+class TestResults:
+    """Simple test result tracker"""
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.failures = []
+
+    def assert_equal(self, actual, expected, test_name):
+        if actual == expected:
+            self.passed += 1
+            print(f"✓ {test_name}")
+        else:
+            self.failed += 1
+            msg = f"✗ {test_name}: expected '{expected}', got '{actual}'"
+            self.failures.append(msg)
+            print(msg)
+
+    def print_summary(self):
+        print("\n" + "=" * 60)
+        print(f"PASSED: {self.passed}")
+        print(f"FAILED: {self.failed}")
+        if self.failures:
+            print("\nFailures:")
+            for f in self.failures:
+                print(f"  {f}")
+        print("=" * 60)
+        return self.failed == 0
+
+
+results = TestResults()
+
+
+# Patterns that are searched through search_ignorecase()
+PATTERNS = {
+    "ANY_REFERENCE_PATTERN": ANY_REFERENCE_PATTERN,
+    "REF_KEYWORD_PATTERN": REF_KEYWORD_PATTERN,
+    "IAW_KEYWORD_PATTERN": IAW_KEYWORD_PATTERN,
+    "_REV_WINDOW_RE": _REV_WINDOW_RE,
+    "B787_DOC_PATTERN": B787_DOC_PATTERN,
+    "DATA_MODULE_TASK_PATTERN": DATA_MODULE_TASK_PATTERN,
+    "DATA_MODULE_TASK_TEXT": DATA_MODULE_TASK_TEXT,
+    "DMC_PATTERN": DMC_PATTERN,
+    "DOC_ID_PATTERN": DOC_ID_PATTERN,
+    "NDT_REPORT_PATTERN": NDT_REPORT_PATTERN,
+    "REFERENCED_PATTERN": REFERENCED_PATTERN,
+    "REVISION_ANY_PATTERN": REVISION_ANY_PATTERN,
+    "SB_FULL_PATTERN": SB_FULL_PATTERN,
+}
+
+BASE_TEXTS = [
+    "",
+    "N/A",
+    "INSPECTED, NO DEFECT FOUND",
+    "IAW AMM 32-11-00 REV 45",
+    "Performed per amm 05-51-01 rev: 12",
+    "REF SRM 53-10-00 ISSUE 3",
+    "done iaw CMM 32-41-11 issued sd 7",
+    "DMC-B787-A-52-09-01-00A-520A-A",
+    "B787-A-32-11-00-00A-280A-A REV 2",
+    "NDT REPORT NDT-2024-001 attached",
+    "DATA MODULE TASK 123 IAW SB 787-53-0012",
+    "sb b787-53-0012 per EO",
+    "REFERENCED AMM TASK 12-13-14",
+    "TAR 12345 applied",
+    "AMM 24-22-00 REV 01/JAN/2024",
+    "ipc 32-11-01 rev15 fig 2",
+    "Replaced tyre IAW AMM32-45-11",
+    "AMM\x1c12-34-56\x1dREV\x1e7",  # ASCII separators count as \s
+    "amm\t12-34-56\nrev 3",
+    "Revision date 2024-05-01, exp date 12/2025",
+    "WO: 123 456 REFER WT 3",
+    "Checked İAW AMM 12-34-56 REV 2",  # dotted capital I
+    "amm 12-34-56 rev ı",  # dotless small i
+    "Ｆｕｌｌｗｉｄｔｈ AMM 12",
+    "ſb 787-53-0012",  # long s
+    "K-kelvin Kelvin sign K DMC-ABC-1",
+]
+
+
+def _case_variants(text):
+    return {text, text.lower(), text.upper(), text.swapcase(), text.title()}
+
+
+TEXTS = sorted({v for t in BASE_TEXTS for v in _case_variants(t)})
+
+
+def _span(match):
+    return match.span() if match else None
+
+
+def test_search_ignorecase_equivalence():
+    """search_ignorecase() finds the same span as an IGNORECASE search"""
+    print("\n=== Testing search_ignorecase() Equivalence ===")
+
+    for name, pattern in PATTERNS.items():
+        mismatches = [
+            text for text in TEXTS
+            if _span(search_ignorecase(pattern, text)) != _span(pattern.search(text))
+        ]
+        results.assert_equal(mismatches, [], f"{name} on {len(TEXTS)} texts")
+
+
+def test_search_ignorecase_non_ascii():
+    """Non-ASCII text is searched with the original pattern, unchanged"""
+    print("\n=== Testing search_ignorecase() on Non-ASCII Text ===")
+
+    text = "Checked İAW AMM 12-34-56 REV 2"
+    match = search_ignorecase(IAW_KEYWORD_PATTERN, text)
+    results.assert_equal(
+        match.string if match else None, text, "Match refers to the original text"
+    )
+
+
+def test_may_have_reference_prefilter():
+    """may_have_reference() is False only when has_any_reference() is"""
+    print("\n=== Testing may_have_reference() Prefilter ===")
+
+    missed = [t for t in TEXTS if has_any_reference(t) and not may_have_reference(t)]
+    results.assert_equal(missed, [], f"No reference rejected in {len(TEXTS)} texts")
+
+    results.assert_equal(may_have_reference("INSPECTED OK"), False, "Plain text rejected")
+    results.assert_equal(may_have_reference("İnspected"), True, "Non-ASCII text passes")
+    results.assert_equal(may_have_reference(None), False, "None rejected")
+    results.assert_equal(may_have_reference(12.5), False, "Number rejected")
+
+
+def test_batch_matches_single():
+    """check_ref_keywords_batch() equals check_ref_keywords() per row"""
+    print("\n=== Testing check_ref_keywords_batch() ===")
+
+    texts = [
+        "IAW AMM 32-11-00 REV 45",
+        "IAW AMM 32-11-00",
+        "Replaced tyre",
+        None,
+        float("nan"),
+        pd.NA,
+        "N/A",
+        ["not", "hashable"],
+        "DMC-B787-A-52-09-01-00A-520A-A",
+        "Replaced tyre",
+    ]
+    seq_values = ["1.1", "9.2", "5.1", "4.1", "4.2", None, float("nan"), "4.4", "4.5", "9.1"]
+    header_texts = [
+        "CLOSE UP", "AMM 12-34-56", "AMM 12-34-56", None, "", pd.NA,
+        "JOB SET UP", "AMM 12", {"un": "hashable"}, "",
+    ]
+    des_texts = ["", None, "AMM 10-11-12", "", pd.NA, "", "", "", "", "AMM 1"]
+
+    expected = [
+        check_ref_keywords(t, s, h, d)
+        for t, s, h, d in zip(texts, seq_values, header_texts, des_texts)
+    ]
+    actual = check_ref_keywords_batch(texts, seq_values, header_texts, des_texts)
+    results.assert_equal(actual, expected, "Plain lists")
+
+    df = pd.DataFrame({
+        "text": pd.Series(texts, dtype=object),
+        "seq": pd.Series(seq_values, dtype=object),
+        "header": pd.Series(header_texts, dtype=object),
+        "des": pd.Series(des_texts, dtype=object),
+    })
+    actual = check_ref_keywords_batch(df["text"], df["seq"], df["header"], df["des"])
+    results.assert_equal(actual, expected, "DataFrame columns")
+
+    # Second pass is served from the cache and must not change anything
+    actual = check_ref_keywords_batch(texts, seq_values, header_texts, des_texts)
+    results.assert_equal(actual, expected, "Cached second pass")
+
+
+def run_all_tests():
+    """Run all test suites"""
+    print("=" * 60)
+    print("VALIDATION FAST PATH TEST SUITE")
+    print("=" * 60)
+
+    test_search_ignorecase_equivalence()
+    test_search_ignorecase_non_ascii()
+    test_may_have_reference_prefilter()
+    test_batch_matches_single()
+
+    success = results.print_summary()
+
+    if success:
+        print("\n🎉 ALL TESTS PASSED!")
+        return 0
+    else:
+        print("\n❌ SOME TESTS FAILED - Please review")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+
+    exit_code = run_all_tests()
+    sys.exit(exit_code)
@@ -0,0 +1,254 @@
+# doc_validator/tests/test_interface_helpers.py
+"""
+Tests for the non-visual GUI helpers:
+
+- FileListModel check mask and checked_rows() over filtered rows
+- SettingsManager coalesced, diff-only, atomic save
+- EmittingStream line buffering and repeat thinning
+
+Needs PyQt6; runs without a display (offscreen platform).
+
+Run with:
+    python -m doc_validator.tests.test_interface_helpers
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from doc_validator.core.input_source_manager import FileInfo
+from doc_validator.interface.models.file_list_model import CHECK_COLUMN, FileListModel
+from doc_validator.interface.settings_manager import SettingsManager
+from doc_validator.interface.workers.processing_worker import EmittingStream
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestResults:
+    """Simple test result tracker"""
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.failures = []
+
+    def assert_equal(self, actual, expected, test_name):
+        if actual == expected:
+            self.passed += 1
+            print(f"✓ {test_name}")
+        else:
+            self.failed += 1
+            msg = f"✗ {test_name}: expected '{expected}', got '{actual}'"
+            self.failures.append(msg)
+            print(msg)
+
+    def print_summary(self):
+        print("\n" + "=" * 60)
+        print(f"PASSED: {self.passed}")
+        print(f"FAILED: {self.failed}")
+        if self.failures:
+            print("\nFailures:")
+            for f in self.failures:
+                print(f"  {f}")
+        print("=" * 60)
+        return self.failed == 0
+
+
+results = TestResults()
+
+
+def _local_files(count):
+    return [
+        FileInfo(name=f"f{i}.xlsx", source_type="local", local_path=f"/nonexistent/f{i}.xlsx")
+        for i in range(count)
+    ]
+
+
+def test_file_list_model_checks():
+    """Check states follow the full list; checked_rows() the shown rows"""
+    print("\n=== Testing FileListModel Checks ===")
+
+    model = FileListModel()
+    files = _local_files(5)
+    model.set_files(files)
+    results.assert_equal(model.checked_rows(), [], "Nothing checked after set_files")
+
+    model.set_all_checked(True)
+    results.assert_equal(model.checked_rows(), [0, 1, 2, 3, 4], "Select all")
+
+    model.setData(model.index(1, CHECK_COLUMN), Qt.CheckState.Unchecked.value,
+                  Qt.ItemDataRole.CheckStateRole)
+    results.assert_equal(model.checked_rows(), [0, 2, 3, 4], "Uncheck one row")
+
+    # Filtered view: rows are display positions within the shown subset
+    model.set_files(files, rows=[4, 2])
+    model.set_all_checked(True)
+    results.assert_equal(model.checked_rows(), [0, 1], "Select all shown")
+    results.assert_equal(
+        [model.file_at(r).name for r in model.checked_rows()],
+        ["f4.xlsx", "f2.xlsx"],
+        "Checked files of the filtered view",
+    )
+    results.assert_equal(
+        model.data(model.index(0, CHECK_COLUMN), Qt.ItemDataRole.CheckStateRole),
+        Qt.CheckState.Checked,
+        "Check state shown",
+    )
+
+    model.set_all_checked(False)
+    results.assert_equal(model.checked_rows(), [], "Deselect all shown")
+
+    model.set_files([])
+    model.set_all_checked(True)
+    results.assert_equal(model.checked_rows(), [], "Empty model")
+
+
+def test_settings_manager_save():
+    """set() coalesces into one delayed write of the non-default values"""
+    print("\n=== Testing SettingsManager Saving ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "settings.json"
+        manager = SettingsManager(path)
+        results.assert_equal(json.loads(path.read_text()), {}, "Defaults stored as {}")
+
+        writes = []
+        real_save = manager.save
+        manager.save = lambda: (writes.append(1), real_save())
+
+        manager.set("date_filter_enabled", True)
+        manager.set("date_filter_start", "2024-01-01")
+        manager.set("date_filter_start", "2024-02-01")
+        results.assert_equal(json.loads(path.read_text()), {}, "set() doesn't write at once")
+
+        deadline = time.time() + 5
+        while not writes and time.time() < deadline:
+            time.sleep(0.05)
+        time.sleep(manager.SAVE_DELAY_SECONDS)
+        results.assert_equal(len(writes), 1, "One write for a burst of set() calls")
+        results.assert_equal(
+            json.loads(path.read_text()),
+            {"date_filter_enabled": True, "date_filter_start": "2024-02-01"},
+            "Only changed values stored",
+        )
+        results.assert_equal(
+            os.listdir(tmp), ["settings.json"], "No temporary file left behind"
+        )
+
+        manager.set_many({"date_filter_enabled": False, "date_filter_end": "2024-03-01"})
+        results.assert_equal(
+            json.loads(path.read_text()),
+            {"date_filter_start": "2024-02-01", "date_filter_end": "2024-03-01"},
+            "set_many() writes at once; defaults dropped",
+        )
+
+        manager.set("input_source_type", "drive")
+        manager.flush()
+        reloaded = SettingsManager(path)
+        results.assert_equal(reloaded.get("input_source_type"), "drive", "flush() persisted")
+        results.assert_equal(
+            reloaded.get("seq_auto_valid_patterns"),
+            SettingsManager.DEFAULT_SETTINGS["seq_auto_valid_patterns"],
+            "Defaults merged back on load",
+        )
+
+
+def _capturing_stream():
+    received = []
+    stream = EmittingStream(received.append, None)
+    stream.capture_current_thread()
+    return stream, received
+
+
+def test_emitting_stream_lines():
+    """Text is handed over per completed line, partial lines on flush()"""
+    print("\n=== Testing EmittingStream Line Buffering ===")
+
+    stream, received = _capturing_stream()
+    stream.write("Processing ")
+    stream.write("file.xlsx")
+    results.assert_equal(received, [], "Partial line held back")
+    stream.write("\n")
+    results.assert_equal(received, ["Processing file.xlsx\n"], "Completed line handed over")
+
+    stream.write("tail without newline")
+    stream.flush()
+    results.assert_equal(received[-1], "tail without newline", "flush() hands over the rest")
+
+    other = []
+    thread = threading.Thread(target=lambda: stream.write("other thread\n"))
+    stream.sink = other.append
+    thread.start()
+    thread.join()
+    results.assert_equal(other, [], "Unregistered threads not mirrored")
+
+
+def test_emitting_stream_repeats():
+    """Runs of one line are cut to REPEAT_LIMIT copies plus a count"""
+    print("\n=== Testing EmittingStream Repeat Thinning ===")
+
+    stream, received = _capturing_stream()
+    limit = EmittingStream.REPEAT_LIMIT
+    for _ in range(limit + 1 + 5):
+        stream.write("same line\n")
+    stream.write("next line\n")
+    results.assert_equal(
+        "".join(received),
+        "same line\n" * (limit + 1)
+        + "   [last line repeated 5 more times]\n"
+        + "next line\n",
+        "Repeats replaced by a count",
+    )
+
+    stream, received = _capturing_stream()
+    for _ in range(limit + 3):
+        stream.write("last\n")
+    stream.flush()
+    results.assert_equal(
+        received[-1], "   [last line repeated 2 more times]\n", "flush() closes a pending count"
+    )
+
+    stream, received = _capturing_stream()
+    cap = EmittingStream.MAX_LINES_PER_EMIT
+    stream.write("".join(f"line {i}\n" for i in range(cap + 10)))
+    lines = received[0].splitlines()
+    results.assert_equal(
+        (lines[0], lines[1], len(lines)),
+        ("... 10 lines not shown ...", "line 10", cap + 1),
+        "One hand-over keeps its last MAX_LINES_PER_EMIT lines",
+    )
+
+
+def run_all_tests():
+    """Run all test suites"""
+    print("=" * 60)
+    print("GUI HELPER TEST SUITE")
+    print("=" * 60)
+
+    test_file_list_model_checks()
+    test_settings_manager_save()
+    test_emitting_stream_lines()
+    test_emitting_stream_repeats()
+
+    success = results.print_summary()
+
+    if success:
+        print("\n🎉 ALL TESTS PASSED!")
+        return 0
+    else:
+        print("\n❌ SOME TESTS FAILED - Please review")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+
+    exit_code = run_all_tests()
+    sys.exit(exit_code)
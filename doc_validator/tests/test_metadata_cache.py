@@ -0,0 +1,153 @@
+# doc_validator/tests/test_metadata_cache.py
+"""
+Tests for the SQLite Drive listing cache (core/metadata_cache.py):
+
+- load() of a folder that was never saved
+- save() / load() round trip, order and fields preserved
+- saving one folder evicts every other folder
+- an unreadable cache file is treated as empty
+
+Run with:
+    python -m doc_validator.tests.test_metadata_cache
+"""
+
+import os
+import tempfile
+import time
+
+from doc_validator.core import metadata_cache
+from doc_validator.core.input_source_manager import FileInfo
+
+
+class TestResults:
+    """Simple test result tracker"""
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.failures = []
+
+    def assert_equal(self, actual, expected, test_name):
+        if actual == expected:
+            self.passed += 1
+            print(f"✓ {test_name}")
+        else:
+            self.failed += 1
+            msg = f"✗ {test_name}: expected '{expected}', got '{actual}'"
+            self.failures.append(msg)
+            print(msg)
+
+    def print_summary(self):
+        print("\n" + "=" * 60)
+        print(f"PASSED: {self.passed}")
+        print(f"FAILED: {self.failed}")
+        if self.failures:
+            print("\nFailures:")
+            for f in self.failures:
+                print(f"  {f}")
+        print("=" * 60)
+        return self.failed == 0
+
+
+results = TestResults()
+
+
+def _drive_file(name, file_id, mime_type="application/vnd.ms-excel"):
+    return FileInfo(name=name, source_type="drive", file_id=file_id, mime_type=mime_type)
+
+
+LISTING = [
+    _drive_file("b.xlsx", "id-b"),
+    _drive_file("A.XLS", "id-a", mime_type=""),
+    _drive_file("c.xlsx", "id-c", mime_type=None),
+]
+
+
+def test_load_missing():
+    """Nothing cached -> None (also creates the cache file's folder)"""
+    print("\n=== Testing load() Without a Cache ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "sub", "cache.sqlite3")
+        results.assert_equal(metadata_cache.load("folder", db_path), None, "Unknown folder")
+
+
+def test_round_trip():
+    """save() then load() returns the same files, in order"""
+    print("\n=== Testing save() / load() Round Trip ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.sqlite3")
+        before = time.time()
+        metadata_cache.save("folder", LISTING, db_path)
+        files, fetched_at = metadata_cache.load("folder", db_path)
+
+        results.assert_equal(files, LISTING, "Files and order preserved")
+        results.assert_equal(before <= fetched_at <= time.time(), True, "fetched_at is the save time")
+
+        metadata_cache.save("folder", LISTING[:1], db_path)
+        files, _ = metadata_cache.load("folder", db_path)
+        results.assert_equal(files, LISTING[:1], "Second save replaces the listing")
+
+        metadata_cache.save("folder", [], db_path)
+        results.assert_equal(
+            metadata_cache.load("folder", db_path)[0], [], "Empty listing is cached"
+        )
+
+
+def test_other_folders_evicted():
+    """Only the last saved folder is kept"""
+    print("\n=== Testing Folder Eviction ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.sqlite3")
+        metadata_cache.save("first", LISTING, db_path)
+        metadata_cache.save("second", LISTING[1:], db_path)
+
+        results.assert_equal(metadata_cache.load("first", db_path), None, "Old folder evicted")
+        results.assert_equal(
+            metadata_cache.load("second", db_path)[0], LISTING[1:], "New folder kept"
+        )
+
+
+def test_unreadable_cache():
+    """A corrupt cache file reads as empty, and saving doesn't raise"""
+    print("\n=== Testing an Unreadable Cache File ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.sqlite3")
+        with open(db_path, "wb") as f:
+            f.write(b"this is not a database" * 100)
+
+        results.assert_equal(metadata_cache.load("folder", db_path), None, "load() gives None")
+        metadata_cache.save("folder", LISTING, db_path)  # warns, doesn't raise
+        results.assert_equal(
+            metadata_cache.load("folder", db_path), None, "save() skipped without raising"
+        )
+
+
+def run_all_tests():
+    """Run all test suites"""
+    print("=" * 60)
+    print("DRIVE METADATA CACHE TEST SUITE")
+    print("=" * 60)
+
+    test_load_missing()
+    test_round_trip()
+    test_other_folders_evicted()
+    test_unreadable_cache()
+
+    success = results.print_summary()
+
+    if success:
+        print("\n🎉 ALL TESTS PASSED!")
+        return 0
+    else:
+        print("\n❌ SOME TESTS FAILED - Please review")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+
+    exit_code = run_all_tests()
+    sys.exit(exit_code)
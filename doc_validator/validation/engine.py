@@ -1,8 +1,12 @@
+from functools import lru_cache
+from typing import Iterable, List
+
 from .helpers import (
     fix_common_typos,
+    get_seq_auto_valid_patterns,
     has_revision,
     has_primary_reference,
-    has_dmc_or_doc_id,
+    has_any_reference,
     has_ndt_report,
     has_sb_full_number,
     has_data_module_task,
@@ -12,8 +16,9 @@ from .helpers import (
     has_iaw_keyword,
     is_seq_auto_valid,
     is_seq_9x,
+    may_have_reference,
 )
-from .patterns import DOC_ID_PATTERN
+from .patterns import DOC_ID_PATTERN, search_ignorecase
 
 
 def _des_has_any_reference(des_text):
@@ -38,22 +43,29 @@ def _des_has_any_reference(des_text):
     if not isinstance(des_text, str):
         des_text = str(des_text)
 
+    return _des_text_has_any_reference(des_text)
+
+
+@lru_cache(maxsize=8192)
+def _des_text_has_any_reference(des_text):
+    """
+    String part of _des_has_any_reference. Memoized on its own: a DES
+    repeats on every row of its group, with different row texts, so the
+    _classify_row cache alone doesn't catch it.
+    """
     cleaned = fix_common_typos(des_text)
 
-    if has_primary_reference(cleaned):
-        return True
-    if has_dmc_or_doc_id(cleaned):
-        return True
-    if has_ndt_report(cleaned):
-        return True
-    if has_sb_full_number(cleaned):
-        return True
-    if has_data_module_task(cleaned):
-        return True
-    if has_referenced_pattern(cleaned):
-        return True
+    return may_have_reference(cleaned) and has_any_reference(cleaned)
+
 
-    return False
+def _enforce_reference(seq_value, des_text):
+    """
+    Decide if we should enforce "Missing reference" based on DES context.
+    BUT: For SEQ 9.x, we always enforce if missing reference (ignore DES).
+    """
+    if is_seq_9x(seq_value):
+        return True  # Always enforce for SEQ 9.x
+    return _des_has_any_reference(des_text)
 
 
 def check_ref_keywords(text, seq_value=None, header_text=None, des_text=None):
@@ -91,6 +103,52 @@ def check_ref_keywords(text, seq_value=None, header_text=None, des_text=None):
        - If HAS primary reference:
            * If no revision -> "Missing revision"
            * Else -> "Valid" (with doc-ID+IAW special-case kept)
+
+    Results are memoized on the four inputs plus the SEQ auto-valid
+    settings, since work packages repeat the same texts across many rows.
+    """
+    try:
+        return _classify_row(
+            text, seq_value, header_text, des_text, get_seq_auto_valid_patterns()
+        )
+    except TypeError:  # unhashable cell value; classify without the cache
+        return _classify_row.__wrapped__(
+            text, seq_value, header_text, des_text, get_seq_auto_valid_patterns()
+        )
+
+
+def check_ref_keywords_batch(
+    texts: Iterable,
+    seq_values: Iterable,
+    header_texts: Iterable,
+    des_texts: Iterable,
+) -> List[str]:
+    """
+    check_ref_keywords over whole columns (e.g. DataFrame Series), zipped
+    row by row. Much cheaper than DataFrame.apply(axis=1), which builds
+    a Series for every row.
+    """
+    seq_patterns = get_seq_auto_valid_patterns()
+    reasons = []
+    for text, seq_value, header_text, des_text in zip(
+        texts, seq_values, header_texts, des_texts
+    ):
+        try:
+            reason = _classify_row(text, seq_value, header_text, des_text, seq_patterns)
+        except TypeError:  # unhashable cell value
+            reason = _classify_row.__wrapped__(
+                text, seq_value, header_text, des_text, seq_patterns
+            )
+        reasons.append(reason)
+    return reasons
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _classify_row(text, seq_value, header_text, des_text, seq_patterns):
+    """
+    Body of check_ref_keywords. seq_patterns only keys the cache
+    (is_seq_auto_valid reads the same setting), so changing the
+    settings never returns a stale result.
     """
 
     # ========== STEP 0: Check SEQ for auto-valid patterns ==========
@@ -127,6 +185,12 @@ def check_ref_keywords(text, seq_value=None, header_text=None, des_text=None):
 
     # ========== STEP 5: Special patterns ==========
 
+    # Neither the special patterns nor a primary reference can match
+    # without one of the trigger substrings: go straight to step 6's
+    # "no primary reference" outcome
+    if not may_have_reference(cleaned):
+        return "Missing reference" if _enforce_reference(seq_value, des_text) else "Valid"
+
     # 5A: "REFERENCED AMM/SRM/etc."
     if has_referenced_pattern(cleaned):
         return "Valid"
@@ -135,31 +199,24 @@ def check_ref_keywords(text, seq_value=None, header_text=None, des_text=None):
     if has_ndt_report(cleaned):
         return "Valid"
 
+    # 5C and 5D both need an SB full number; search for it once
+    sb_full = has_sb_full_number(cleaned)
+
     # 5C: DATA MODULE TASK + SB reference
-    if has_data_module_task(cleaned) and has_sb_full_number(cleaned):
+    if sb_full and has_data_module_task(cleaned):
         return "Valid"
 
     # 5D: SB with full number + linking word (IAW/REF/PER)
     iaw = has_iaw_keyword(cleaned)
-    if has_sb_full_number(cleaned) and iaw:
+    if sb_full and iaw:
         return "Valid"
 
     # ========== STEP 6: Check for PRIMARY reference ==========
     primary = has_primary_reference(cleaned)
 
-    # Check if this is SEQ 9.x
-    is_seq_9 = is_seq_9x(seq_value)
-
-    # Decide if we should enforce "Missing reference" based on DES context
-    # BUT: For SEQ 9.x, we always enforce if missing reference (ignore DES)
-    if is_seq_9:
-        enforce_reference = True  # Always enforce for SEQ 9.x
-    else:
-        enforce_reference = _des_has_any_reference(des_text)
-
     if not primary:
         # No AMM/SRM/etc. in this row.
-        if enforce_reference:
+        if _enforce_reference(seq_value, des_text):
             # Either SEQ 9.x OR DES has some reference => enforce
             return "Missing reference"
         else:
@@ -173,7 +230,7 @@ def check_ref_keywords(text, seq_value=None, header_text=None, des_text=None):
         return "Valid"
 
     # Optional special case: doc ID + linking word (IAW/REF/PER)
-    doc_id = DOC_ID_PATTERN.search(cleaned)
+    doc_id = search_ignorecase(DOC_ID_PATTERN, cleaned)
     if doc_id and iaw:
         return "Valid"
 
@@ -1,7 +1,8 @@
 # doc_validator/validation/helpers.py (UPDATED)
 
 import re
-from typing import List, Optional
+from functools import lru_cache, wraps
+from typing import List, Optional, Tuple
 
 from .constants import (
     REF_KEYWORDS,
@@ -13,21 +14,17 @@ from .patterns import (
     DMC_PATTERN,
     B787_DOC_PATTERN,
     DATA_MODULE_TASK_TEXT,
-    REV_PATTERN,
-    ISSUE_PATTERN,
-    ISSUED_SD_PATTERN,
-    TAR_PATTERN,
-    EXP_DATE_PATTERN,
-    DEADLINE_DATE_PATTERN,
+    REVISION_ANY_PATTERN,
     REFERENCED_PATTERN,
     NDT_REPORT_PATTERN,
     SB_FULL_PATTERN,
     DATA_MODULE_TASK_PATTERN,
+    search_ignorecase,
 )
 
 # Precompiled patterns based on config keywords
 REF_KEYWORD_PATTERN = re.compile(
-    r'\b(?:' + '|'.join(re.escape(k) for k in REF_KEYWORDS) + r')\b',
+    r'\b(?:' + '|'.join(re.escape(k.upper()) for k in REF_KEYWORDS) + r')\b',
     re.IGNORECASE,
 )
 
@@ -36,8 +33,102 @@ IAW_KEYWORD_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Every kind of document reference has_any_reference() looks for, as one
+# alternation: primary keyword, DMC, B787 doc, DATA MODULE TASK, NDT
+# REPORT, SB full number and "REFERENCED <type>"
+ANY_REFERENCE_PATTERN = re.compile(
+    '|'.join(
+        f'(?:{p.pattern})'
+        for p in (
+            REF_KEYWORD_PATTERN,
+            DMC_PATTERN,
+            B787_DOC_PATTERN,
+            DATA_MODULE_TASK_TEXT,
+            NDT_REPORT_PATTERN,
+            SB_FULL_PATTERN,
+            DATA_MODULE_TASK_PATTERN,
+            REFERENCED_PATTERN,
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# has_revision() 12-character window after "REV": the window starts after
+# any separators, and counts as a revision if it has a digit and any of:
+#   1. a number at the start (156, 002, 123)
+#   2. a month name as a word (AUG 01/2025, 01AUG 25)
+#   3. a month between digits (01AUG25, 15JAN2025)
+#   4. a month at the start with a digit later (AUG01/2025, JAN 15/2025)
+#   5. a slash/dash date (01/11/2025, 2025-01-15)
+_MONTHS = r'(?:JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)'
+_REV_WINDOW_START_RE = re.compile(r'\bREV[ :\\.\-]*', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+_REV_WINDOW_RE = re.compile(
+    rf'^\d|\b{_MONTHS}\b|\d{_MONTHS}\d|^{_MONTHS}.*\d|\d[/\-]\d+[/\-]\d',
+    re.IGNORECASE,
+)
+
+# Substrings (upper case) of which every ANY_REFERENCE_PATTERN match
+# contains at least one: the keywords, plus the fixed words of the other
+# patterns. Triggers containing a shorter trigger add nothing and are
+# dropped ("AMMS" is covered by "AMM", "VSB" by "SB").
+_REFERENCE_TRIGGERS = {k.upper() for k in REF_KEYWORDS} | {"DMC", "B787-", "DATA", "NDT", "SB"}
+_REFERENCE_TRIGGERS = tuple(sorted(
+    t for t in _REFERENCE_TRIGGERS
+    if not any(o != t and o in t for o in _REFERENCE_TRIGGERS)
+))
+
+# fix_common_typos() rewrites, applied in this order
+_TYPO_REV_NUMBER_RE = re.compile(r"\bREV[:\.]?\s*(\d+)\b", re.IGNORECASE)
+_TYPO_REV_AFTER_TOKEN_RE = re.compile(r"([A-Za-z0-9\)\]])rev(\d+)\b", re.IGNORECASE)
+_TYPO_REF_LETTER_RE = re.compile(r"\bREF([A-Z])", re.IGNORECASE)
+# One alternation for all keywords: none is followed by a digit inside
+# another, so at most one keyword can match at any position
+_TYPO_REF_KEYWORD_DIGIT_RE = re.compile(
+    r"\b(" + "|".join(re.escape(k) for k in REF_KEYWORDS) + r")(\d)",
+    re.IGNORECASE,
+)
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+# Substring checks as single alternations, matched against upper-cased
+# text (the keywords and phrases are all upper case)
+_HEADER_SKIP_RE = re.compile('|'.join(re.escape(k) for k in HEADER_SKIP_KEYWORDS))
+_SKIP_PHRASE_RE = re.compile(
+    '|'.join(
+        # 1) Existing skip phrases
+        [re.escape(p) for p in SKIP_PHRASES]
+        # 2) Cross-Workstep (WT) references
+        + [re.escape("REFER RESULT WT"), re.escape("REFER WT ")]
+        # 3) Cross-Workorder (WO) references; this also covers WO + EOD
+        + [r"\bWO\s*[:\-]\s*[0-9`' ]+"]
+    )
+)
+
+
+def _memoize_text(maxsize):
+    """
+    lru_cache for a one-argument text helper, applied to str input only.
+    Other input (NaN, numbers, unhashable cell values) runs uncached, so
+    it gets the helper's own non-str handling instead of a TypeError.
+    """
+    def decorate(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(text):
+            if isinstance(text, str):
+                return cached(text)
+            return func(text)
+
+        return wrapper
+
+    return decorate
+
+
 # Global variable to store custom SEQ patterns from settings
-_seq_auto_valid_patterns: Optional[List[str]] = None
+_seq_auto_valid_patterns: Optional[Tuple[str, ...]] = None
+
+_DEFAULT_SEQ_AUTO_VALID_PATTERNS = ("1.", "2.", "3.", "10.")
 
 
 def set_seq_auto_valid_patterns(patterns: List[str]) -> None:
@@ -48,7 +139,14 @@ def set_seq_auto_valid_patterns(patterns: List[str]) -> None:
         patterns: List of pattern prefixes (e.g., ["1.", "2.", "3.", "10."])
     """
     global _seq_auto_valid_patterns
-    _seq_auto_valid_patterns = patterns if patterns else []
+    _seq_auto_valid_patterns = tuple(patterns) if patterns else ()
+
+
+def get_seq_auto_valid_patterns() -> Tuple[str, ...]:
+    """Return the SEQ auto-valid patterns in effect (settings or defaults)."""
+    if _seq_auto_valid_patterns is None:
+        return _DEFAULT_SEQ_AUTO_VALID_PATTERNS
+    return _seq_auto_valid_patterns
 
 
 def is_seq_auto_valid(seq_value):
@@ -65,23 +163,18 @@ def is_seq_auto_valid(seq_value):
     if seq_value is None:
         return False
 
-    # Convert to string and strip whitespace
-    seq_str = str(seq_value).strip()
+    # Convert to string and strip whitespace. Numbers must go through
+    # str(): 1.5 -> "1.5" matches "1.", the int 1 -> "1" does not.
+    seq_str = seq_value.strip() if isinstance(seq_value, str) else str(seq_value).strip()
 
     if not seq_str:
         return False
 
-    # Use custom patterns from settings, or default patterns
-    patterns = _seq_auto_valid_patterns if _seq_auto_valid_patterns is not None else ["1.", "2.", "3.", "10."]
-
     # Check if SEQ starts with any of the configured patterns
-    for pattern in patterns:
-        if seq_str.startswith(pattern):
-            return True
-
-    return False
+    return seq_str.startswith(get_seq_auto_valid_patterns())
 
 
+@_memoize_text(maxsize=4096)
 def contains_header_skip_keyword(header_text):
     """
     Check if wo_text_action.header contains keywords that should skip validation.
@@ -100,98 +193,79 @@ def contains_header_skip_keyword(header_text):
     normalized = " ".join(header_text.upper().split())
 
     # Check against all header skip keywords
-    for keyword in HEADER_SKIP_KEYWORDS:
-        if keyword in normalized:
-            return True
-
-    return False
+    return bool(_HEADER_SKIP_RE.search(normalized))
 
 
+@_memoize_text(maxsize=4096)
 def fix_common_typos(text: str) -> str:
     """Normalize common typos in maintenance documentation."""
     if not isinstance(text, str):
         return text
 
     t = text
-    # Normalize "REV" formats
-    t = re.sub(r"(?i)\bREV[:\.]?\s*(\d+)\b", r"REV \1", t)
-    t = re.sub(r"(?i)\brev(\d+)\b", r"rev \1", t)
-    t = re.sub(r"([A-Za-z0-9\)\]])rev(\d+)\b", r"\1 rev \2", t, flags=re.IGNORECASE)
+    # Normalize "REV" formats. (A separate "revNN" -> "rev NN" pass used
+    # to follow; the first substitution already rewrites everything it
+    # could match.)
+    t = _TYPO_REV_NUMBER_RE.sub(r"REV \1", t)
+    t = _TYPO_REV_AFTER_TOKEN_RE.sub(r"\1 rev \2", t)
 
     # Space after REF
-    t = re.sub(r"(?i)\bREF([A-Z])", r"REF \1", t)
+    t = _TYPO_REF_LETTER_RE.sub(r"REF \1", t)
 
     # Ensure space after REF keywords when followed by a digit
-    for ref in REF_KEYWORDS:
-        t = re.sub(fr"(?i)\b({re.escape(ref)})(\d)", r"\1 \2", t)
+    t = _TYPO_REF_KEYWORD_DIGIT_RE.sub(r"\1 \2", t)
 
     # Collapse multiple spaces
-    t = re.sub(r"\s{2,}", " ", t)
+    t = _MULTI_SPACE_RE.sub(" ", t)
     return t
 
 
+@_memoize_text(maxsize=4096)
 def contains_skip_phrase(text: str) -> bool:
     """Check if text contains phrases that should skip validation (WT/WO cross-reference, etc)."""
     if not isinstance(text, str):
         return False
 
-    up = text.upper()
-
-    # 1) Existing skip phrases
-    for phrase in SKIP_PHRASES:
-        if phrase in up:
-            return True
-
-    # 2) Cross-Workstep (WT) references
-    if "REFER RESULT WT" in up or "REFER WT " in up:
-        return True
-
-    # 3) Cross-Workorder (WO) references
-    if re.search(r"\bWO\s*[:\-]\s*[0-9`' ]+", up):
-        return True
-
-    # 4) WO together with EOD (Engineering Order)
-    if "EOD" in up and re.search(r"\bWO\s*[:\-]\s*[0-9`' ]+", up):
-        return True
-
-    return False
+    # Skip phrases, WT and WO cross-references (see _SKIP_PHRASE_RE)
+    return bool(_SKIP_PHRASE_RE.search(text.upper()))
 
 
 def has_referenced_pattern(text: str) -> bool:
     """Check if text uses 'REFERENCED AMM/SRM/etc.' pattern."""
     if not isinstance(text, str):
         return False
-    return bool(REFERENCED_PATTERN.search(text))
+    return bool(search_ignorecase(REFERENCED_PATTERN, text))
 
 
 def has_ndt_report(text: str) -> bool:
     """Check for NDT REPORT pattern with document ID."""
     if not isinstance(text, str):
         return False
-    return bool(NDT_REPORT_PATTERN.search(text))
+    return bool(search_ignorecase(NDT_REPORT_PATTERN, text))
 
 
 def has_sb_full_number(text: str) -> bool:
     """Check for Service Bulletin with full number."""
     if not isinstance(text, str):
         return False
-    return bool(SB_FULL_PATTERN.search(text))
+    return bool(search_ignorecase(SB_FULL_PATTERN, text))
 
 
 def has_data_module_task(text: str) -> bool:
     """Check for DATA MODULE TASK pattern (with number)."""
     if not isinstance(text, str):
         return False
-    return bool(DATA_MODULE_TASK_PATTERN.search(text))
+    return bool(search_ignorecase(DATA_MODULE_TASK_PATTERN, text))
 
 
+@_memoize_text(maxsize=4096)
 def has_primary_reference(text: str) -> bool:
     """
     Check if text contains a primary reference keyword (AMM, SRM, CMM, etc.).
     """
     if not isinstance(text, str):
         return False
-    return bool(REF_KEYWORD_PATTERN.search(text))
+    return bool(search_ignorecase(REF_KEYWORD_PATTERN, text))
 
 
 def has_dmc_or_doc_id(text: str) -> bool:
@@ -203,27 +277,57 @@ def has_dmc_or_doc_id(text: str) -> bool:
         return False
 
     # DMC pattern
-    if DMC_PATTERN.search(text):
+    if search_ignorecase(DMC_PATTERN, text):
         return True
 
     # B787 document pattern
-    if B787_DOC_PATTERN.search(text):
+    if search_ignorecase(B787_DOC_PATTERN, text):
         return True
 
     # "DATA MODULE TASK" text (without number)
-    if DATA_MODULE_TASK_TEXT.search(text):
+    if search_ignorecase(DATA_MODULE_TASK_TEXT, text):
         return True
 
     return False
 
 
+def has_any_reference(text: str) -> bool:
+    """
+    Check if text contains any kind of document reference.
+
+    Same result as has_primary_reference, has_dmc_or_doc_id,
+    has_ndt_report, has_sb_full_number, has_data_module_task or
+    has_referenced_pattern being true, in a single search.
+    """
+    if not isinstance(text, str):
+        return False
+    return bool(search_ignorecase(ANY_REFERENCE_PATTERN, text))
+
+
+def may_have_reference(text: str) -> bool:
+    """
+    Cheap pre-check for has_any_reference(): False only if the text can't
+    contain any document reference. Plain substring tests, no regex.
+
+    Non-ASCII text always passes, since IGNORECASE matching and
+    str.upper() don't agree on it (a dotted capital I matches "I").
+    """
+    if not isinstance(text, str):
+        return False
+    if not text.isascii():
+        return True
+    upper = text.upper()
+    return any(trigger in upper for trigger in _REFERENCE_TRIGGERS)
+
+
 def has_iaw_keyword(text: str) -> bool:
     """Check if text contains linking words (IAW, REF, PER)."""
     if not isinstance(text, str):
         return False
-    return bool(IAW_KEYWORD_PATTERN.search(text))
+    return bool(search_ignorecase(IAW_KEYWORD_PATTERN, text))
 
 
+@_memoize_text(maxsize=4096)
 def has_revision(text: str) -> bool:
     """
     Check if text contains any revision indicator.
@@ -248,95 +352,21 @@ def has_revision(text: str) -> bool:
     if not isinstance(text, str):
         return False
 
-    # Standard patterns (faster checks)
-    REV_PATTERN = re.compile(r'\bREV\s*[:\.]?\s*\d+\b', re.IGNORECASE)
-    ISSUE_PATTERN = re.compile(r'\bISSUE\s*[:\.]?\s*\d+\b', re.IGNORECASE)
-    ISSUED_SD_PATTERN = re.compile(r'\bISSUED\s+SD\.?\s*\d+\b', re.IGNORECASE)
-    TAR_PATTERN = re.compile(r'\bTAR\s*\d+\b', re.IGNORECASE)
-    EXP_DATE_PATTERN = re.compile(
-        r'\b(?:EXP|DEADLINE|DUE\s+DATE|REV\s+DATE)\s*[:\.]?\s*\d{1,2}[-/]?[A-Z]{3}[-/]?\d{2,4}\b',
-        re.IGNORECASE,
-    )
-    DEADLINE_DATE_PATTERN = re.compile(
-        r'\b(?:EXP|DEADLINE|DUE\s+DATE|REV\s+DATE)\s*[:\.]?\s*\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}\b',
-        re.IGNORECASE,
-    )
-
-    if REV_PATTERN.search(text):
-        return True
-    if ISSUE_PATTERN.search(text):
-        return True
-    if ISSUED_SD_PATTERN.search(text):
-        return True
-    if TAR_PATTERN.search(text):
-        return True
-    if EXP_DATE_PATTERN.search(text):
-        return True
-    if DEADLINE_DATE_PATTERN.search(text):
+    # Standard patterns (REV/ISSUE/ISSUED SD/TAR/EXP/DEADLINE), one search
+    if search_ignorecase(REVISION_ANY_PATTERN, text):
         return True
 
     # NEW: Flexible 12-character window check after REV
     # FIXED: Look for "REV" without requiring word boundary after it
-    # This handles both "REV 156" and "REVAUG 01/2025"
-    rev_matches = re.finditer(r'\bREV', text, re.IGNORECASE)
-
-    for match in rev_matches:
-        # Get position right after "REV"
-        start_pos = match.end()
-
-        # Extract up to 12 characters after REV
-        if start_pos >= len(text):
-            continue
-
-        # Skip optional whitespace/separators (0 or more)
-        # This handles both "REV 156" and "REV156" and "REVAUG01/2025"
-        search_start = start_pos
-        while search_start < len(text) and text[search_start] in ' :\.\-':
-            search_start += 1
-
-        # Extract 12 characters from this position
-        window = text[search_start:search_start + 12]
-
-        if not window:
-            continue
-
-        # Check if this window contains revision-like content
-        # Valid revision must have:
-        # 1. At least one digit (for numbers or dates)
-        # 2. Optionally, a month name (for date formats)
-
-        # First, check if there's any digit
-        if not re.search(r'\d', window):
-            continue  # No digit = not a revision
-
-        # If we have a digit, check for valid patterns:
-
-        # Pattern 1: Pure numbers (156, 002, 123)
-        # Must have continuous digits (standalone number)
-        if re.match(r'^\d+', window):
-            return True
-
-        # Pattern 2: Date with month name (AUG 01/2025, 01AUG 25, 01AUG25)
-        # Month abbreviations: JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC
-        if re.search(r'\b(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\b',
-                     window, re.IGNORECASE):
-            return True
-
-        # Pattern 3: Date-like patterns without word boundaries
-        # Handles compact forms like "01AUG25", "15JAN2025"
-        if re.search(r'\d+(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\d+',
-                     window, re.IGNORECASE):
-            return True
-
-        # Pattern 4: Month at start followed by digits
-        # Handles "AUG01/2025", "JAN 15/2025"
-        if re.search(r'^(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC).*\d',
-                     window, re.IGNORECASE):
-            return True
-
-        # Pattern 5: Standard date formats with slashes/dashes
-        # 01/11/2025, 2025-01-15, etc.
-        if re.search(r'\d+[\/\-]\d+[\/\-]\d+', window):
+    # This handles both "REV 156" and "REVAUG 01/2025". Optional
+    # separators after REV are skipped, then the next 12 characters are
+    # the window.
+    for match in _REV_WINDOW_START_RE.finditer(text):
+        window = text[match.end():match.end() + 12]
+
+        # Valid revision must have at least one digit (for numbers or
+        # dates), then one of the number / date shapes in _REV_WINDOW_RE
+        if _DIGIT_RE.search(window) and search_ignorecase(_REV_WINDOW_RE, window):
             return True
 
     return False
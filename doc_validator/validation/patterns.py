@@ -5,6 +5,37 @@ import re
 
 from .constants import REF_KEYWORDS
 
+# Case-sensitive twins of the IGNORECASE patterns, built on first use.
+# Every letter in these patterns is upper case, so on upper-cased ASCII
+# text a twin matches exactly where the original would, and skips the
+# (much slower) case-insensitive matching. Twins only see ASCII text, so
+# they also use re.ASCII's cheaper \b / \d tests; \s gets back the
+# \x1c-\x1f separators that re.ASCII leaves out (no pattern here has \s
+# inside a [...] class).
+_UPPER_TWINS = {}
+
+
+def search_ignorecase(pattern, text):
+    """
+    pattern.search(text) for an IGNORECASE pattern written with upper
+    case letters only, like the ones in this module.
+
+    ASCII text is upper-cased and searched with the pattern's
+    case-sensitive twin; the match then refers to the upper-cased text.
+    Other text is searched as is, since str.upper() and IGNORECASE don't
+    agree on every non-ASCII character.
+    """
+    if not text.isascii():
+        return pattern.search(text)
+    twin = _UPPER_TWINS.get(pattern)
+    if twin is None:
+        twin = _UPPER_TWINS[pattern] = re.compile(
+            pattern.pattern.replace(r'\s', r'[\s\x1c-\x1f]'),
+            (pattern.flags & ~(re.IGNORECASE | re.UNICODE)) | re.ASCII,
+        )
+    return twin.search(text.upper())
+
+
 # Document ID pattern
 DOC_ID_PATTERN = re.compile(r'\b[A-Z0-9]{1,4}[0-9A-Z\-]{0,}\d+\b', re.IGNORECASE)
 
@@ -39,9 +70,26 @@ DEADLINE_DATE_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# All of the revision patterns above as one alternation, so has_revision()
+# needs a single search instead of six
+REVISION_ANY_PATTERN = re.compile(
+    '|'.join(
+        f'(?:{p.pattern})'
+        for p in (
+            REV_PATTERN,
+            ISSUE_PATTERN,
+            ISSUED_SD_PATTERN,
+            TAR_PATTERN,
+            EXP_DATE_PATTERN,
+            DEADLINE_DATE_PATTERN,
+        )
+    ),
+    re.IGNORECASE,
+)
+
 # Pattern for "REFERENCED AMM/SRM/etc."
 REFERENCED_PATTERN = re.compile(
-    r'\bREFERENCED\s+(?:' + '|'.join(re.escape(k) for k in REF_KEYWORDS) + r')\b',
+    r'\bREFERENCED\s+(?:' + '|'.join(re.escape(k.upper()) for k in REF_KEYWORDS) + r')\b',
     re.IGNORECASE,
 )
 